@@ -0,0 +1,72 @@
+"""
+Copyright (c) 2025 Open Compute Project
+Licensed under the MIT License.
+
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+
+===========================================================================
+CompiledStep is an immutable, slotted view of a scenario step dictionary. It is
+built once when a scenario is loaded so executors can read step fields as plain
+attributes instead of repeating dictionary lookups on every execution.
+
+Features:
+- Resolves the step fields used by the executors in a single pass.
+- Normalizes boolean flags such as `continue` and `use_sudo`.
+- Frozen and slotted to keep per-step memory small and prevent mutation.
+
+Classes:
+    CompiledStep:
+        Read-only representation of a single test step.
+
+Usage:
+    Call `CompiledStep.from_dict(step)` with a raw step dictionary.
+    Access fields as attributes, e.g. `compiled.command` or `compiled.connection`.
+===========================================================================
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledStep:
+    step_id: Any
+    step_name: Any
+    step_type: Any
+    command: Any
+    connection: Any
+    connection_type: Any
+    continue_flag: bool
+    container_name: Any
+    use_sudo: bool
+    duration: Any
+    output_analysis: Any
+    expected_output: Any
+    expected_output_path: Any
+
+    @classmethod
+    def from_dict(cls, step: dict) -> "CompiledStep":
+        """
+        Builds a CompiledStep from a raw scenario step dictionary.
+        Args:
+            step (dict): The step definition as loaded from the scenario file.
+        Returns:
+            CompiledStep: The compiled, read-only step.
+        """
+        get = step.get
+        return cls(
+            step_id=get("step_id"),
+            step_name=get("step_name"),
+            step_type=get("step_type"),
+            command=get("step_command"),
+            connection=get("connection"),
+            connection_type=get("connection_type"),
+            continue_flag=bool(get("continue", False)),
+            container_name=get("container_name"),
+            use_sudo=bool(get("use_sudo", False)),
+            duration=get("duration"),
+            output_analysis=get("output_analysis"),
+            expected_output=get("expected_output"),
+            expected_output_path=get("expected_output_path"),
+        )
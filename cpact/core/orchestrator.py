@@ -34,8 +34,10 @@ import time
 from typing import Any, Type, List
 
 from core.context import Context
+from core.compiled_step import CompiledStep
 from core.scenario_runner import ScenarioRunner
 from core.step_executor import StepExecutor
+from executor.executor_factory import ExecutorFactory
 
 from concurrent.futures import ThreadPoolExecutor
 from result_builder.result_builder import ResultCollector
@@ -145,6 +147,7 @@ class Orchestrator:
         )
         if steps:
             self.logger.info(f"Running inline steps...")
+            ResultCollector.get_instance().preallocate(len(steps))
             run = tv.TestRun(name=scenario.get("test_name"), version="1.0")
             dut = tv.Dut(id=scenario["test_id"], name=scenario["test_name"])
             run.start(dut=dut)
@@ -153,11 +156,19 @@ class Orchestrator:
                 severity=LogSeverity.INFO,
             )
             run_status = True
-            for step in steps:
+            executor_classes = [
+                ExecutorFactory.EXECUTOR_MAP.get(step.get("step_type"))
+                for step in steps
+            ]
+            compiled_steps = [CompiledStep.from_dict(step) for step in steps]
+            for step, executor_cls, compiled_step in zip(
+                steps, executor_classes, compiled_steps
+            ):
                 scenario_step = run.add_step(
                     name=f"Step: ID:{step.get('step_id', 'Unnamed Step')}_{step.get('step_name', 'Unnamed Step')}"
                 )
                 scenario_step.__setattr__("step_details", step)
+                scenario_step.__setattr__("compiled_step", compiled_step)
 
                 with scenario_step.scope():
                     start_time = time.time()
@@ -170,6 +181,7 @@ class Orchestrator:
                         scenario_step,
                         self.context,
                         executor=self.executor_continue,
+                        executor_cls=executor_cls,
                     ).run()
                     if not status:
                         self.logger.error(f"Step failed: {message}")
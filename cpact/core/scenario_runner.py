@@ -30,7 +30,9 @@ Usage:
 """
 from concurrent.futures import ThreadPoolExecutor
 from core.context import Context
+from core.compiled_step import CompiledStep
 from core.step_executor import StepExecutor
+from executor.executor_factory import ExecutorFactory
 from utils.logger_utils import TestLogger
 from utils.logger_utils import OCPTVFileWriter
 import ocptv.output as tv
@@ -66,6 +68,12 @@ class ScenarioRunner:
         self.context = context
         self.executor_continue = thread_executor or ThreadPoolExecutor(max_workers=5)
         self.validate_continue = validate_continue
+        # Resolve executor classes and compiled steps once per scenario, aligned with the step index.
+        steps = scenario.get("test_steps", [])
+        self.executor_classes = [
+            ExecutorFactory.EXECUTOR_MAP.get(step.get("step_type")) for step in steps
+        ]
+        self.compiled_steps = [CompiledStep.from_dict(step) for step in steps]
 
     def run(self) -> tuple[None, bool, str]:
         """
@@ -93,17 +101,21 @@ class ScenarioRunner:
             severity=LogSeverity.INFO,
         )
         run_status = True
-        for step in steps:
+        for step, executor_cls, compiled_step in zip(
+            steps, self.executor_classes, self.compiled_steps
+        ):
             scenario_step = run.add_step(
                 name=f"Step: ID:{step.get('step_id', 'Unnamed Step')}_{step.get('step_name', 'Unnamed Step')}"
             )
             scenario_step.__setattr__("step_details", step)
+            scenario_step.__setattr__("compiled_step", compiled_step)
             with scenario_step.scope():
                 executor = StepExecutor(
                     data.get("test_id"),
                     scenario_step,
                     self.context,
                     executor=self.executor_continue,
+                    executor_cls=executor_cls,
                 )
                 output, status, message = executor.run(
                     validate_continue=self.validate_continue
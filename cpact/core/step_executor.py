@@ -29,6 +29,7 @@ Usage:
 ===========================================================================
 """
 import time
+from typing import Type
 
 from executor.command_executor import CommandExecutor
 from concurrent.futures import ThreadPoolExecutor
@@ -56,6 +57,7 @@ class StepExecutor:
         scenario_step: tv.step,
         context: Context,
         executor: ThreadPoolExecutor = None,
+        executor_cls: Type[CommandExecutor | LogAnalyzer | ScenarioInvoker] = None,
     ) -> None:
         """
         Initializes the StepExecutor with a scenario step, context, and optional thread executor for continued steps.
@@ -64,6 +66,8 @@ class StepExecutor:
             scenario_step (tv.step): The test step to be executed.
             context (Context): The shared context for storing and managing data.
             executor (ThreadPoolExecutor): Optional thread pool executor for handling continued steps.
+            executor_cls (type): Optional executor class already resolved for the step type.
+                Falls back to ExecutorFactory when not provided.
         Returns:
             None
         """
@@ -74,6 +78,7 @@ class StepExecutor:
         self.evaluator = ExpressionEvaluator(context)
         self.scenario_id = scenario_id
         self.thread_executor = executor
+        self.executor_cls = executor_cls
 
     def run(self, validate_continue: bool = False) -> tuple[str, bool, str]:
         """
@@ -94,7 +99,7 @@ class StepExecutor:
             self.logger.info(
                 f"[SKIP] Entry criteria '{entry_criteria}' not met. Skipping step. {diagnostic_keys}"
             )
-            ResultCollector().get_instance().add_step_result(
+            ResultCollector.get_instance().add_step_result(
                 self.scenario_id,
                 step_id=self.step_details["step_id"],
                 step_name=self.step_details["step_name"],
@@ -159,7 +164,9 @@ class StepExecutor:
             tuple: A tuple containing the output, a boolean indicating success or failure, and a message.
         """
         test_id = self.context.get("test_id")
-        executor_cls = ExecutorFactory.get_executor(self.step_details["step_type"])
+        executor_cls = self.executor_cls or ExecutorFactory.get_executor(
+            self.step_details["step_type"]
+        )
         executor = executor_cls(
             self.scenario_step,
             self.context,
@@ -168,7 +175,7 @@ class StepExecutor:
         )
         output, status, message = executor.execute()
         if not validate_continue:
-            ResultCollector().get_instance().add_step_result(
+            ResultCollector.get_instance().add_step_result(
                 self.scenario_id,
                 step_id=self.step_details["step_id"],
                 step_name=self.step_details["step_name"],
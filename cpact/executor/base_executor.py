@@ -13,6 +13,7 @@ and scenario invocation.
 
 Features:
 - Stores step metadata and execution context.
+- Exposes the compiled, attribute-based view of the step as `compiled_step`.
 - Supports threaded execution for continued steps.
 - Integrates with centralized logging via TestLogger.
 - Defines an abstract `execute()` method for custom step logic.
@@ -34,6 +35,7 @@ from utils.logger_utils import TestLogger
 import ocptv.output as tv
 from concurrent.futures import ThreadPoolExecutor
 from core.context import Context
+from core.compiled_step import CompiledStep
 
 
 class BaseExecutor(ABC):
@@ -60,6 +62,9 @@ class BaseExecutor(ABC):
         )
         self.scenario_step = scenario_step
         self.step = scenario_step.step_details
+        self.compiled_step = getattr(
+            scenario_step, "compiled_step", None
+        ) or CompiledStep.from_dict(self.step)
         self.context = context
         self.thread_executor = executor
         self.validate_continue = validate_continue
@@ -60,8 +60,9 @@ class CommandExecutor(BaseExecutor):
         Returns:
             tuple: A tuple containing output (str), status (bool), and message (str).
         """
+        step = self.compiled_step
         try:
-            command = self.step.get("step_command")
+            command = step.command
             if not command:
                 self.logger.error("No command provided in step data.")
                 self.scenario_step.add_log(
@@ -71,19 +72,18 @@ class CommandExecutor(BaseExecutor):
 
             if self.validate_continue:
                 self.logger.info(
-                    f"Validating continued step {self.step.get('step_id')} with command: {command}"
+                    f"Validating continued step {step.step_id} with command: {command}"
                 )
                 self.scenario_step.add_log(
                     LogSeverity.INFO,
-                    f"Validating continued step {self.step.get('step_id')} with command: {command}",
+                    f"Validating continued step {step.step_id} with command: {command}",
                 )
                 output = self.validate_continued_step(self.step, self.context)
                 if output["status"] == "fail":
                     return "", False, output["message"]
                 return "", True, "Continued step validated successfully."
 
-            continue_flag = self.step.get("continue", False)
-            if continue_flag:
+            if step.continue_flag:
                 output = self.run_continue_step(
                     self.step, self.context, self.thread_executor
                 )
@@ -97,17 +97,16 @@ class CommandExecutor(BaseExecutor):
                     "Command execution started in background and will continue until completed.",
                 )
 
-            check_docker_step = self.check_docker_step(self.step)
-            if check_docker_step:
-                command = f'docker exec {self.step.get("container_name")} {command}'
+            if step.container_name:
+                command = f"docker exec {step.container_name} {command}"
                 self.logger.info(f"Executing Docker command: {command}")
                 self.scenario_step.add_log(
                     LogSeverity.INFO, f"Executing Docker command: {command}"
                 )
                 # return self.execute_docker_step(step=self.step, context=self.context)
 
-            connection_name = self.step.get("connection")
-            connection_type = self.step.get("connection_type")
+            connection_name = step.connection
+            connection_type = step.connection_type
             if not connection_name or not connection_type:
                 self.logger.error("Connection name or type not provided in step data.")
                 self.scenario_step.add_log(
@@ -159,8 +158,14 @@ class CommandExecutor(BaseExecutor):
             log_dir = TestLogger().get_log_dir()
             output_dir = os.path.join(log_dir, "command_outputs")
             os.makedirs(output_dir, exist_ok=True)
-            step_id = self.step.get("step_id", f"step_{int(time.time())}")
-            step_name = re.sub(r"\W+", "_", self.step.get("step_name", "unnamed_step"))
+            # Fall back only when the field is absent; falsy ids such as 0 are kept
+            step_id = step.step_id
+            if step_id is None:
+                step_id = f"step_{int(time.time())}"
+            step_name = step.step_name
+            if step_name is None:
+                step_name = "unnamed_step"
+            step_name = re.sub(r"\W+", "_", step_name)
             output_file_name = (
                 f"{self.context.get('test_id')}_{step_id}_{step_name}.txt"
             )
@@ -173,7 +178,7 @@ class CommandExecutor(BaseExecutor):
             self.scenario_step.add_log(
                 LogSeverity.INFO, f"Command executed successfully: {command}"
             )
-            output_analysis = self.step.get("output_analysis")
+            output_analysis = step.output_analysis
             if output_analysis:
                 self.logger.info(
                     f"Output analysis enabled with rules: {output_analysis}"
@@ -184,8 +189,8 @@ class CommandExecutor(BaseExecutor):
                 )
                 self.output_analysis(output, output_analysis)
 
-            expected_output = self.step.get("expected_output")
-            expected_output_path = self.step.get("expected_output_path")
+            expected_output = step.expected_output
+            expected_output_path = step.expected_output_path
             if expected_output or expected_output_path:
                 output, status, message = self.output_validation(
                     output, expected_output, expected_output_path
@@ -457,12 +462,10 @@ class CommandExecutor(BaseExecutor):
                     LogSeverity.INFO,
                     f"Output validation status: {status}, message: {message}",
                 )
-                ResultCollector().get_instance().update_step_result(
+                ResultCollector.get_instance().finalize_step(
                     step_id=step.get("step_id"),
-                    step_name=step.get("step_name"),
-                    step_type=step.get("step_type"),
                     status="success" if status else "fail",
-                    duration=round(time.time() - self.context.get("start_time"), 3),
+                    duration=time.time() - self.context.get("start_time"),
                     message=message,
                 )
                 if not status:
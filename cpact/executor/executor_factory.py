@@ -50,7 +50,7 @@ class ExecutorFactory:
         Returns:
             type: The executor class corresponding to the step type.
         """
-        executor_cls = ExecutorFactory.EXECUTOR_MAP.get(step_type)
-        if not executor_cls:
-            raise ValueError(f"No executor found for step type: {step_type}")
-        return executor_cls
+        try:
+            return ExecutorFactory.EXECUTOR_MAP[step_type]
+        except KeyError:
+            raise ValueError(f"No executor found for step type: {step_type}") from None
@@ -103,13 +103,13 @@ class LogAnalyzer(BaseExecutor):
             )
             return None, False, "Log path is required for LogAnalyzer step."
         self.logger.info(f"Analyzing log: {local_log_dir}")
-        self.logger.info(
-            f"Log content: {log_content[:100]}..."
-        )  # Log first 100 characters for brevity
+        # Log first 100 characters for brevity; formatted only if INFO is enabled
+        self.logger.info("Log content: %.100s...", log_content)
         self.scenario_step.add_log(LogSeverity.INFO, f"Analyzing log: {local_log_dir}")
+        # The OCPTV record is part of the test artifact, independent of console verbosity
         self.scenario_step.add_log(
             LogSeverity.INFO, f"Log content: {log_content[:100]}..."
-        )  # Log first 100 characters for brevity
+        )
 
         diagnostic_analysis = self.step.get("diagnostic_analysis")
         if diagnostic_analysis:
@@ -11,7 +11,7 @@ from within a parent scenario. It loads and executes external scenario files, en
 modular and reusable test design.
 
 Features:
-- Loads external scenario files using a defined path.
+- Loads external scenario files using a defined path, reusing cached parses.
 - Delegates execution to ScenarioRunner with shared context.
 - Supports threaded execution and continued step validation.
 - Enables hierarchical scenario composition and reuse.
@@ -26,18 +26,26 @@ Usage:
     Define `scenario_path` in the step to specify the external scenario file.
 =============================================================================
 """
-from utils.scenario_parser import load_yaml_file
+import os
+from typing import TYPE_CHECKING
+
+from utils.scenario_parser import load_yaml_file_cached
 from core.context import Context
-import ocptv.output as tv
-from concurrent.futures import ThreadPoolExecutor
+
+if TYPE_CHECKING:
+    import ocptv.output as tv
+    from concurrent.futures import ThreadPoolExecutor
 
 
 class ScenarioInvoker:
+    # ScenarioRunner class, bound on first execute() to avoid a circular import
+    _ScenarioRunner = None
+
     def __init__(
         self,
-        scenario_step: tv.step,
+        scenario_step: "tv.step",
         context: Context,
-        thread_executor: ThreadPoolExecutor = None,
+        thread_executor: "ThreadPoolExecutor" = None,
         validate_continue: bool = False,
     ) -> None:
         """
@@ -55,6 +63,10 @@ class ScenarioInvoker:
         self.context = context
         self.thread_executor = thread_executor
         self.validate_continue = validate_continue
+        # Resolve the nested scenario path once; execute() may be retried on this
+        # instance. The file is stat'ed on every load so edits are picked up.
+        scenario_path = self.step.get("scenario_path") if self.step else None
+        self._scenario_abspath = os.path.abspath(scenario_path) if scenario_path else None
 
     def execute(self) -> tuple[str, bool, str]:
         """
@@ -62,17 +74,20 @@ class ScenarioInvoker:
         Returns:
             tuple: A tuple containing output (str), status (bool), and message (str).
         """
+        if ScenarioInvoker._ScenarioRunner is None:
+            from core.scenario_runner import (
+                ScenarioRunner,
+            )  # Delayed import to avoid circular import
 
-        from core.scenario_runner import (
-            ScenarioRunner,
-        )  # Delayed import to avoid circular import
+            ScenarioInvoker._ScenarioRunner = ScenarioRunner
 
-        scenario_path = self.step.get("scenario_path")
-        if not scenario_path:
+        if not self._scenario_abspath:
             raise ValueError("Scenario path is required for ScenarioInvoker step.")
-        scenario = load_yaml_file(scenario_path)
-        runner = ScenarioRunner(
-            scenario["test_scenario"],
+        test_scenario = load_yaml_file_cached(
+            self._scenario_abspath, key="test_scenario"
+        )
+        runner = ScenarioInvoker._ScenarioRunner(
+            test_scenario,
             self.context,
             thread_executor=self.thread_executor,
             validate_continue=self.validate_continue,
@@ -11,8 +11,14 @@ diagnostic context keys in automated test scenarios. It supports dynamic express
 parsing and integrates with a shared context and centralized logging system.
 
 Features:
-- Evaluates entry criteria expressions using Python's eval.
-- Supports logical and comparison operators (and, or, not, ==, !=, >, >=, <, <=).
+- Evaluates entry criteria expressions without Python's eval where the syntax allows.
+- Parses each expression once into a closure tree dispatching to the operator table.
+- Caches compiled expressions across evaluator instances.
+- Evaluates multiple criteria as one combined expression, re-checking individually only on failure.
+- Memoizes results per expression and the values of the diagnostic keys it references.
+- Supports logical, comparison, membership and identity operators (and, or, not, ==, !=,
+  >, >=, <, <=, in, not in, is, is not) and list, tuple and set literals.
+- Falls back to Python's eval for any other expression syntax.
 - Logs evaluation results and errors for traceability.
 - Designed to work with diagnostic key-value pairs and scenario context.
 - Provides fallback handling for missing or malformed expressions.
@@ -24,18 +30,36 @@ Classes:
 Usage:
     Instantiate ExpressionEvaluator with a context object.
     Call `evaluate(entry_criteria, diagnostic_keys)` to validate criteria.
-    Expressions should be valid Python syntax referencing keys in `diagnostic_keys`.
+    Expressions use Python syntax (names, literals, comparisons, and/or/not) referencing keys in `diagnostic_keys`.
 ===========================================================================
 """
 
+import ast
 import operator
-from typing import Union, List, Dict, Type
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Union
 from utils.logger_utils import TestLogger
 from core.context import Context
 
+# Placeholder for names absent from the diagnostic keys in result cache keys.
+_MISSING = object()
+
 
 class ExpressionEvaluator:
-    def __init__(self, context: Type[Context]) -> None:
+    # Compiled expressions shared by all instances; StepExecutor creates one evaluator per step.
+    # Combined criteria lists are keyed by the tuple of their expressions.
+    _compiled: dict[str | tuple, Callable[[dict], Any]] = {}
+    # Diagnostic key names each compiled expression reads, keyed like _compiled.
+    _names: dict[str | tuple, tuple[str, ...]] = {}
+    # Results keyed by (expression, values of the names it reads), oldest evicted first.
+    _results: dict[tuple, Any] = {}
+    _results_lock = threading.Lock()
+    RESULT_CACHE_MAXSIZE = 256
+
+    __slots__ = ("logger", "context", "operators", "_compare_ops")
+
+    def __init__(self, context: Context) -> None:
         """
         Initializes the ExpressionEvaluator with a context for variable resolution.
         Args:
@@ -55,6 +79,22 @@ class ExpressionEvaluator:
             ">=": operator.ge,
             "<": operator.lt,
             "<=": operator.le,
+            "in": lambda a, b: a in b,
+            "not in": lambda a, b: a not in b,
+            "is": operator.is_,
+            "is not": operator.is_not,
+        }
+        self._compare_ops = {
+            ast.Eq: self.operators["=="],
+            ast.NotEq: self.operators["!="],
+            ast.Gt: self.operators[">"],
+            ast.GtE: self.operators[">="],
+            ast.Lt: self.operators["<"],
+            ast.LtE: self.operators["<="],
+            ast.In: self.operators["in"],
+            ast.NotIn: self.operators["not in"],
+            ast.Is: self.operators["is"],
+            ast.IsNot: self.operators["is not"],
         }
 
     def evaluate(
@@ -68,16 +108,46 @@ class ExpressionEvaluator:
         Returns:
             bool: True if all criteria are met, False otherwise.
         """
-        results = []
+        # Take one read-only snapshot for the whole batch so every criterion sees
+        # the same keys while continued steps may still be updating the context.
+        env = MappingProxyType(dict(diagnostic_keys))
+        if len(entry_criteria) > 1 and self._evaluate_combined(entry_criteria, env):
+            return True
+        # Re-check criteria one by one only on failure so the log names the failing one.
         for criteria in entry_criteria:
-            if not self._evaluate_single(criteria, diagnostic_keys):
-                self.logger.info(f"Entry criteria '{criteria}' not met. Skipping step.")
-                # return False
-                results.append(False)
-            results.append(True)
-        if len(results) == 1:
-            return results[0]
-        return all(results)
+            if not self._evaluate_single(criteria, env):
+                self.logger.info("Entry criteria '%s' not met. Skipping step.", criteria)
+                return False
+        return True
+
+    def _evaluate_combined(self, entry_criteria: list, diagnostic_keys: dict) -> bool:
+        """
+        Evaluates all criteria as a single compiled 'and' expression.
+        Args:
+            entry_criteria (list): The entry criteria to be evaluated.
+            diagnostic_keys (dict): The diagnostic keys to be used in the evaluation.
+        Returns:
+            bool: True if all criteria are met, False if any fails or cannot be evaluated.
+        """
+        expressions = tuple(criteria.get("expression") for criteria in entry_criteria)
+        if not all(expressions):
+            return False
+        try:
+            compiled = self._compiled.get(expressions)
+            if compiled is None:
+                compiled = self._compile(
+                    expressions,
+                    lambda: ast.BoolOp(
+                        op=ast.And(),
+                        values=[self._parse(expression) for expression in expressions],
+                    ),
+                )
+            result = self._run(expressions, compiled, diagnostic_keys)
+        except Exception:
+            return False
+        if result:
+            self.logger.info("[Expression] %d criteria => %s", len(expressions), result)
+        return bool(result)
 
     def _evaluate_single(
         self, entry_criteria: Union[list, dict], diagnostic_keys: dict
@@ -95,9 +165,183 @@ class ExpressionEvaluator:
             self.logger.warning("No expression provided for evaluation.")
             return False
         try:
-            result = eval(expression, {}, diagnostic_keys)
-            self.logger.info(f"[Expression] '{expression}' => {result}")
+            compiled = self._compiled.get(expression)
+            if compiled is None:
+                compiled = self._compile(expression, lambda: self._parse(expression))
+            result = self._run(expression, compiled, diagnostic_keys)
+            self.logger.info("[Expression] '%s' => %s", expression, result)
             return result
         except Exception as e:
-            self.logger.error(f"Failed to evaluate expression '{expression}': {e}")
+            self.logger.error("Failed to evaluate expression '%s': %s", expression, e)
             return False
+
+    def _compile(
+        self, key: str | tuple, parse: Callable[[], ast.AST]
+    ) -> Callable[[dict], Any]:
+        """
+        Builds a callable for an expression and caches it with the names it reads.
+        Expressions outside the operator table are compiled with Python's compile and
+        run with eval, as before. Expressions that fail to parse are cached as a
+        callable raising the same error, so they are rejected without re-parsing.
+        Args:
+            key (str or tuple): The expression source, or the tuple of sources for a combined expression.
+            parse (Callable): Returns the parsed expression node.
+        Returns:
+            Callable: A function taking the diagnostic keys and returning the expression value.
+        """
+        try:
+            node = parse()
+        except (SyntaxError, ValueError) as e:
+            message = str(e)
+
+            def compiled(keys: dict) -> Any:
+                raise ValueError(message)
+
+            names = ()
+        else:
+            try:
+                compiled = self._compile_node(node)
+            except ValueError:
+                code = compile(
+                    ast.fix_missing_locations(ast.Expression(body=node)),
+                    "<expression>",
+                    "eval",
+                )
+
+                def compiled(keys: dict) -> Any:
+                    return eval(code, {}, keys)
+
+            names = {child.id for child in ast.walk(node) if isinstance(child, ast.Name)}
+        self._names[key] = tuple(sorted(names))
+        self._compiled[key] = compiled
+        return compiled
+
+    def _run(
+        self, key: str | tuple, compiled: Callable[[dict], Any], diagnostic_keys: dict
+    ) -> Any:
+        """
+        Runs a compiled expression, reusing the previous result when the keys it reads are unchanged.
+        Args:
+            key (str or tuple): The cache key the expression was compiled under.
+            compiled (Callable): The compiled expression.
+            diagnostic_keys (dict): The diagnostic keys to be used in the evaluation.
+        Returns:
+            Any: The expression value.
+        """
+        try:
+            memo_key = (
+                key,
+                tuple(diagnostic_keys.get(name, _MISSING) for name in self._names[key]),
+            )
+            hash(memo_key)
+        except TypeError:
+            # Unhashable key values (lists, dicts) are evaluated without caching.
+            return compiled(diagnostic_keys)
+        with self._results_lock:
+            if memo_key in self._results:
+                return self._results[memo_key]
+        result = compiled(diagnostic_keys)
+        with self._results_lock:
+            self._results[memo_key] = result
+            if len(self._results) > self.RESULT_CACHE_MAXSIZE:
+                del self._results[next(iter(self._results))]
+        return result
+
+    def _parse(self, expression: str) -> ast.AST:
+        """
+        Parses an expression into the body node of its AST.
+        Args:
+            expression (str): The expression source.
+        Returns:
+            ast.AST: The parsed expression node.
+        """
+        return ast.parse(expression.strip(), mode="eval").body
+
+    def _compile_node(self, node: ast.AST) -> Callable[[dict], Any]:
+        """
+        Compiles a single AST node into a closure over its compiled children.
+        Args:
+            node (ast.AST): The node to compile.
+        Returns:
+            Callable: A function taking the diagnostic keys and returning the node value.
+        Raises:
+            ValueError: If the node uses syntax outside the supported operators.
+        """
+        if isinstance(node, ast.Constant):
+            value = node.value
+            return lambda keys: value
+
+        if isinstance(node, ast.Name):
+            name = node.id
+
+            def _name(keys: dict) -> Any:
+                try:
+                    return keys[name]
+                except KeyError:
+                    raise NameError(f"name '{name}' is not defined") from None
+
+            return _name
+
+        if isinstance(node, ast.UnaryOp):
+            if isinstance(node.op, ast.Not):
+                operand = self._compile_node(node.operand)
+                not_ = self.operators["not"]
+                return lambda keys: not_(operand(keys))
+            if isinstance(node.op, ast.USub) and isinstance(node.operand, ast.Constant):
+                value = -node.operand.value
+                return lambda keys: value
+
+        if isinstance(node, ast.BoolOp):
+            # Python's and/or short-circuit and return an operand, so they are
+            # walked here rather than dispatched to the bitwise operator functions.
+            values = [self._compile_node(value) for value in node.values]
+            if isinstance(node.op, ast.And):
+
+                def _and(keys: dict) -> Any:
+                    result = True
+                    for value in values:
+                        result = value(keys)
+                        if not result:
+                            return result
+                    return result
+
+                return _and
+
+            def _or(keys: dict) -> Any:
+                result = False
+                for value in values:
+                    result = value(keys)
+                    if result:
+                        return result
+                return result
+
+            return _or
+
+        if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+            build = {ast.List: list, ast.Tuple: tuple, ast.Set: set}[type(node)]
+            elements = [self._compile_node(element) for element in node.elts]
+            return lambda keys: build([element(keys) for element in elements])
+
+        if isinstance(node, ast.Compare):
+            left = self._compile_node(node.left)
+            comparisons = []
+            for op, comparator in zip(node.ops, node.comparators):
+                op_func = self._compare_ops.get(type(op))
+                if op_func is None:
+                    raise ValueError(
+                        f"Unsupported operator '{type(op).__name__}' in expression"
+                    )
+                comparisons.append((op_func, self._compile_node(comparator)))
+
+            def _compare(keys: dict) -> bool:
+                lhs = left(keys)
+                for op_func, right in comparisons:
+                    rhs = right(keys)
+                    if not op_func(lhs, rhs):
+                        return False
+                    lhs = rhs
+                return True
+
+            return _compare
+
+        raise ValueError(f"Unsupported syntax '{type(node).__name__}' in expression")
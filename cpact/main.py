@@ -12,9 +12,12 @@ with detailed logging and result reporting.
 
 Features:
 - Discovers test scenarios from a directory with metadata filtering.
+- Parses each scenario file once per run; discovery, listing and execution share the cached data.
+- Reads only scenario metadata when filtering and listing tests.
+- Loads discovered test files concurrently on a thread pool.
 - Validates scenarios and configuration files against JSON schemas.
 - Tests connectivity for all configured connection types (SSH, Redfish, Local).
-- Executes test scenarios using the Orchestrator engine.
+- Executes test scenarios using the Orchestrator engine, parsing upcoming scenarios in the background.
 - Collects and prints detailed results, diagnostics, and execution summaries.
 - Supports exporting results and connection diagnostics to JSON and CSV.
 
@@ -22,6 +25,7 @@ Components:
     - discover_tests(): Recursively finds valid test files based on filters.
     - run_test(): Executes a single test scenario and logs results.
     - list_tests(): Displays discovered test scenarios in tabular format.
+    - format_grid_table(): Renders list output as a grid table.
     - list_scenarios_with_connections(): Lists scenarios with connection validation status.
     - discover_and_test_connections(): Discovers and tests all connection combinations.
     - calculate_connection_statistics(): Computes statistics from connection test results.
@@ -38,20 +42,27 @@ Usage:
 """
 
 import os
+import math
+import stat
 import time
-import json
 import argparse
-from tabulate import tabulate
-from typing import Dict, List, Any, Type
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Any, Type
 from versions import get_version_info
 from utils.logger_utils import TestLogger
-from utils.scenario_parser import load_yaml_file
-from utils.scenario_parser import load_yaml_file
-from result_builder.result_builder import ResultCollector
-from schema_checker.schema_factory import ExecutorFactory
-from core.orchestrator import Orchestrator as Orchestrator
-from system_connections.connection_factory import ConnectionFactory
-from system_connections.connection_discovery import ConnectionDiscovery
+from utils.scenario_parser import (
+    load_json_file,
+    load_scenario_metadata,
+    load_yaml_file_cached,
+)
+
+if TYPE_CHECKING:
+    from system_connections.connection_discovery import ConnResult
+
+# The orchestrator, result, schema and connection modules are imported inside the
+# functions that use them, so listing and --help do not pay for loading them.
 
 
 def discover_tests(test_dir: str, filters: list, logger: Type["TestLogger"] = None) -> List[str]:
@@ -59,40 +70,19 @@ def discover_tests(test_dir: str, filters: list, logger: Type["TestLogger"] = No
     Discover all supported test files (YAML or JSON) recursively and filter by test metadata.
     """
     matched_tests = []
-
-    for root, _, files in os.walk(test_dir):
-        for file in files:
-            if not (
-                file.endswith(".yaml")
-                or file.endswith(".yml")
-                or file.endswith(".json")
-            ):
-                continue
-
-            file_path = os.path.join(root, file)
-
+    file_paths = list(_iter_test_files(test_dir))
+    matches = _build_filter(filters)
+
+    # Files are read and parsed on a thread pool; filtering stays on this thread
+    # and follows the walk order.
+    with ThreadPoolExecutor() as pool:
+        loaded = pool.map(_load_metadata, file_paths)
+        for file_path, (metadata, error) in zip(file_paths, loaded):
             try:
-                data = load_yaml_file(file_path)
-                metadata = data.get("test_scenario", {})
-                if filters:
-                    if filters.test_id and filters.test_id != metadata.get("test_id"):
-                        continue
-                    if (
-                        filters.test_name
-                        and filters.test_name.lower()
-                        not in metadata.get("test_name", "").lower()
-                    ):
-                        continue
-                    if filters.test_group and filters.test_group != metadata.get(
-                        "test_group"
-                    ):
-                        continue
-                    if filters.tags and not set(filters.tags).intersection(
-                        set(metadata.get("tags", []))
-                    ):
-                        continue
-
-                matched_tests.append(file_path)
+                if error is not None:
+                    raise error
+                if matches is None or matches(metadata):
+                    matched_tests.append(file_path)
 
             except Exception as e:
                 if logger:
@@ -104,6 +94,67 @@ def discover_tests(test_dir: str, filters: list, logger: Type["TestLogger"] = No
     return matched_tests
 
 
+TEST_FILE_EXTENSIONS = (".yaml", ".yml", ".json")
+
+
+def _iter_test_files(test_dir: str) -> Iterator[str]:
+    """
+    Yield YAML/JSON files under test_dir in the same top-down order as os.walk,
+    using the file type cached in each os.scandir entry. Hidden directories are skipped.
+    """
+    stack = [test_dir]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        subdirs = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink() and not entry.name.startswith("."):
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(TEST_FILE_EXTENSIONS):
+                    yield entry.path
+        stack.extend(reversed(subdirs))
+
+
+def _build_filter(filters) -> Callable[[Dict[str, Any]], bool] | None:
+    """
+    Build the metadata predicate for discover_tests once, with the filter values
+    lowered and converted up front. Returns None when nothing is filtered.
+    """
+    if not filters:
+        return None
+    test_id = filters.test_id
+    test_name = filters.test_name.lower() if filters.test_name else None
+    test_group = filters.test_group
+    tags = frozenset(filters.tags) if filters.tags else None
+
+    def matches(metadata: Dict[str, Any]) -> bool:
+        if test_id and test_id != metadata.get("test_id"):
+            return False
+        if test_name and test_name not in metadata.get("test_name", "").lower():
+            return False
+        if test_group and test_group != metadata.get("test_group"):
+            return False
+        if tags and tags.isdisjoint(metadata.get("tags", ())):
+            return False
+        return True
+
+    return matches
+
+
+def _load_metadata(file_path: str) -> tuple[Dict[str, Any], Exception]:
+    """
+    Load scenario metadata for discover_tests, returning the error instead of raising it.
+    """
+    try:
+        return load_scenario_metadata(file_path) or {}, None
+    except Exception as e:
+        return None, e
+
+
 def run_test(file_path: str, workspace: str, logger=None) -> None:
     """
     Run a single test scenario from the given file path.
@@ -112,10 +163,11 @@ def run_test(file_path: str, workspace: str, logger=None) -> None:
     :param logger: Logger instance for logging.
     :return: None
     """
-    import json
+    from core.orchestrator import Orchestrator
+    from result_builder.result_builder import ResultCollector
 
     logger.info(f"\n🚀 Running Test: {file_path}")
-    scenario_data = load_yaml_file(file_path)
+    scenario_data = load_yaml_file_cached(file_path)
     # with open("scenario.json", 'w') as f:
     #     json.dump(scenario_data, f, indent=2)
     if not scenario_data or "test_scenario" not in scenario_data:
@@ -128,17 +180,136 @@ def run_test(file_path: str, workspace: str, logger=None) -> None:
     elapsed_time = time.time() - start_time
     logger.info(f"✅ Test completed in {elapsed_time:.2f} seconds")
     logger.info("---------------------- Test Summary -------------------------")
-    ResultCollector().get_instance().print_summary()
-    ResultCollector().get_instance().dump_results(
-        os.path.join(TestLogger().get_log_dir(), "test_results.json")
-    )
-    ResultCollector().get_instance().dump_diagnostics(
-        os.path.join(TestLogger().get_log_dir(), "diagnostics_codes.json")
-    )
-    ResultCollector().get_instance().print_summary_table()
+    result_collector = ResultCollector.get_instance()
+    log_dir = TestLogger().get_log_dir()
+    result_collector.print_summary()
+    result_collector.dump_results(os.path.join(log_dir, "test_results.json"))
+    result_collector.dump_diagnostics(os.path.join(log_dir, "diagnostics_codes.json"))
+    result_collector.print_summary_table()
     logger.info(f"⏱️ Total execution time: {elapsed_time:.2f}s\n")
 
 
+def _grid_cell_type(value: Any) -> int:
+    """
+    Classify a cell the way tabulate does: 0 for None, 1 for booleans, 2 for
+    integers, 3 for other numbers and 4 for text. Numeric strings count as numbers.
+    :param value: The cell value.
+    :return: The type rank; a column takes the highest rank of its cells.
+    """
+    if value is None:
+        return 0
+    is_text = isinstance(value, str)
+    if type(value) is bool or (is_text and value in ("True", "False")):
+        return 1
+    if type(value) is int:
+        return 2
+    if is_text:
+        try:
+            int(value)
+            return 2
+        except ValueError:
+            pass
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return 4
+    if is_text and (math.isinf(number) or math.isnan(number)):
+        return 3 if value.lower() in ("inf", "-inf", "nan") else 4
+    return 3
+
+
+def _grid_afterpoint(text: str) -> int:
+    """
+    Count the characters after the decimal point (or exponent) of a formatted
+    number, or -1 for integers and text, as used for decimal alignment.
+    :param text: The formatted cell.
+    :return: The number of characters after the point.
+    """
+    if _grid_cell_type(text) != 3:
+        return -1
+    pos = text.rfind(".")
+    if pos < 0:
+        pos = text.lower().rfind("e")
+    return len(text) - pos - 1 if pos >= 0 else -1
+
+
+def format_grid_table(rows: List[List[Any]], headers: List[str]) -> str:
+    """
+    Render rows as a grid table matching tabulate's "grid" format, with column
+    widths computed in one pass and multi-line cells split across lines.
+    None is rendered as an empty cell. Text and boolean columns are stripped and
+    left-aligned; numeric columns are right-aligned on the decimal point, with
+    floats formatted as format(value, "g").
+    :param rows: Table rows, each with one value per header.
+    :param headers: Column headers.
+    :return: The rendered table.
+    """
+    column_types = [1] * len(headers)
+    for row in rows:
+        for index, cell in enumerate(row):
+            cell_type = _grid_cell_type(cell)
+            if cell_type > column_types[index]:
+                column_types[index] = cell_type
+    numeric = [cell_type in (2, 3) for cell_type in column_types]
+
+    header_texts = [str(header) for header in headers]
+    # As in tabulate, once any header or cell spans lines, empty cells have no lines.
+    multiline = any("\n" in text for text in header_texts) or any(
+        cell is not None and "\n" in str(cell) for row in rows for cell in row
+    )
+    columns = []
+    for index, cells in enumerate(zip(*rows)):
+        if column_types[index] == 3:
+            texts = ["" if cell is None else format(float(cell), "g") for cell in cells]
+        else:
+            texts = ["" if cell is None else str(cell) for cell in cells]
+        if numeric[index]:
+            decimals = [_grid_afterpoint(text) for text in texts]
+            most = max(decimals)
+            texts = [
+                text + " " * (most - count) for text, count in zip(texts, decimals)
+            ]
+        else:
+            texts = [text.strip() for text in texts]
+        columns.append(texts)
+
+    empty = [] if multiline else [""]
+    # Header lines are kept even when empty, so the header row is never collapsed.
+    header_cells = [text.split("\n") for text in header_texts]
+    body = [[text.splitlines() or empty for text in row] for row in zip(*columns)]
+    # Headers get two extra columns of padding, as in tabulate.
+    widths = [max(map(len, cell), default=0) + 2 for cell in header_cells]
+    for row in body:
+        for index, cell in enumerate(row):
+            width = max(map(len, cell), default=0)
+            if width > widths[index]:
+                widths[index] = width
+
+    def border(fill: str) -> str:
+        return "+" + "+".join(fill * (width + 2) for width in widths) + "+"
+
+    def render(cells: List[List[str]]) -> List[str]:
+        height = max(map(len, cells), default=0)
+        lines = []
+        for line in range(height):
+            texts = []
+            for cell, width, right in zip(cells, widths, numeric):
+                text = cell[line] if line < len(cell) else ""
+                texts.append(text.rjust(width) if right else text.ljust(width))
+            lines.append("| " + " | ".join(texts) + " |")
+        return lines
+
+    separator = border("-")
+    lines = [separator, *render(header_cells), border("=")]
+    for row in body:
+        lines.extend(render(row))
+        lines.append(separator)
+    # An empty table is still closed by a bottom rule.
+    if not body:
+        lines.append(separator)
+    return "\n".join(lines)
+
+
 def list_tests(test_files: List[str], logger=None) -> None:
     """
     List all discovered test scenarios in a tabular format.
@@ -152,18 +323,15 @@ def list_tests(test_files: List[str], logger=None) -> None:
     rows = []
     skipped_tests = []
     for test_file in test_files:
-        scenario_data = load_yaml_file(test_file)
-        if logger:
-            logger.debug(f"Processing test file: {test_file}")
-        if not scenario_data or "test_scenario" not in scenario_data:
-            logger.error(f"❌ Invalid test scenario in {test_file}. Skipping.")
-            logger.error(f"❌ No test scenario found in {test_file}. Skipping.")
+        try:
+            test_scenario = load_scenario_metadata(test_file)
+        except ValueError:
+            test_scenario = None
+        if test_scenario is None:
             skipped_tests.append(
                 [test_file, "No test scenario found or invalid format"]
             )
             continue
-        logger.debug(f"Available tests in {test_file}:")
-        test_scenario = scenario_data["test_scenario"]
         rows.append(
             [
                 test_scenario.get("test_id", ""),
@@ -174,16 +342,62 @@ def list_tests(test_files: List[str], logger=None) -> None:
             ]
         )
 
-    logger.info("\n" + tabulate(rows, headers=headers, tablefmt="grid"))
+    # Per-file messages are emitted once after the loop rather than per iteration.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Processed %d test files:\n  %s", len(test_files), "\n  ".join(test_files)
+        )
+    if skipped_tests:
+        logger.error(
+            "❌ No test scenario found or invalid format, skipping:\n  %s",
+            "\n  ".join(test_file for test_file, _ in skipped_tests),
+        )
+
+    logger.info("\n" + format_grid_table(rows, headers))
 
     logger.info("" + "=" * 60)
     if skipped_tests:
         logger.info(f"⚠️ Skipped {len(skipped_tests)} invalid test scenarios:")
         logger.info(
-            "\n" + tabulate(skipped_tests, headers=skipped_header, tablefmt="grid")
+            "\n" + format_grid_table(skipped_tests, skipped_header)
         )
 
 
+def get_scenario_data(
+    scenario_data: Dict[str, Any], connection_details: set[tuple[str, str]]
+) -> None:
+    """
+    Add the (connection, connection_type) pairs used by a scenario's steps, including
+    nested scenario_path includes, to connection_details.
+    """
+    scenario_steps = scenario_data.get("test_steps", [])
+    for step in scenario_steps:
+        if "connection" in step and "connection_type" in step:
+            connection_details.add((step["connection"], step["connection_type"]))
+        if "scenario_path" in step:
+            scenario_path = os.path.abspath(step["scenario_path"])
+            try:
+                mtime_ns = os.stat(scenario_path).st_mtime_ns
+            except OSError:
+                continue
+            connection_details.update(_nested_scenario_connections(scenario_path, mtime_ns))
+
+
+@lru_cache(maxsize=None)
+def _nested_scenario_connections(
+    scenario_path: str, mtime_ns: int
+) -> frozenset[tuple[str, str]]:
+    """
+    Collect the connections used by a nested scenario file once per path and
+    modification time, so scenarios shared by several parents are walked once.
+    """
+    connection_details = set()
+    scenario = load_yaml_file_cached(scenario_path)
+    if "test_scenario" in scenario:
+        get_scenario_data(scenario["test_scenario"], connection_details)
+    return frozenset(connection_details)
+
+
 def list_scenarios_with_connections(
     test_files: List[str], connections: Dict[str, Any], logger=None
 ) -> List[List[Any]]:
@@ -197,38 +411,27 @@ def list_scenarios_with_connections(
         List[List[Any]]: A list of lists containing test scenario details and connection status.
     """
 
-    def get_scenario_data(scenario_data, connection_details=[]):
-        # scenario_data = load_yaml_file(test_file)
-        scenario_steps = scenario_data.get("test_steps", [])
-        for step in scenario_steps:
-            if "connection" in step and "connection_type" in step:
-                connection_details.append((step["connection"], step["connection_type"]))
-            if "scenario_path" in step:
-                scenario_path = step["scenario_path"]
-                if os.path.exists(scenario_path):
-                    scenario = load_yaml_file(scenario_path)
-                    if "test_scenario" in scenario:
-                        get_scenario_data(scenario["test_scenario"], connection_details)
+    # Every configured (connection, connection_type) pair, indexed once for all scenarios.
+    invalid_values = ("N/A", "None", "n/a", "none", "", None)
+    valid_pairs = frozenset(
+        (connection, connection_type)
+        for connection, types in connections.items()
+        if isinstance(types, dict)
+        for connection_type, value in types.items()
+        if value and value not in invalid_values
+    )
 
     def check_scenario_connections(
-        scenario_connection_details: List[tuple[str, str]], connections: Dict[str, Any]
+        scenario_connection_details: set[tuple[str, str]],
     ) -> bool:
         """
-        Check if all connections in the scenario are valid based on the provided connections dictionary.
+        Check if all connections in the scenario are configured and usable.
         Args:
-            scenario_connection_details (List[Tuple[str, str]]): List of tuples containing connection names and types.
-            connections (Dict[str, Any]): Connection configuration dictionary.
+            scenario_connection_details (set[Tuple[str, str]]): Unique pairs of connection names and types.
         Returns:
             bool: True if all connections are valid, False otherwise.
         """
-        for connection, connection_type in scenario_connection_details:
-            c = connections.get(connection)
-            c_t = c.get(connection_type)
-            if not c or not c_t:
-                return False
-            if c and c_t in ["N/A", "None", "n/a", "none", "", None]:
-                return False
-        return True
+        return valid_pairs.issuperset(scenario_connection_details)
 
     headers = [
         "Test ID",
@@ -238,28 +441,36 @@ def list_scenarios_with_connections(
         "Description",
         "Executable",
     ]
-    rows = []
-    for test_file in test_files:
-        connection_details = []
-        test_scenario = load_yaml_file(test_file).get("test_scenario", {})
+    def build_row(test_file: str) -> List[Any] | None:
+        """
+        Build the table row for one scenario file, or None if it has no test scenario.
+        """
+        connection_details = set()
+        test_scenario = load_yaml_file_cached(test_file).get("test_scenario", {})
         if not test_scenario:
-            logger.error(f"❌ No test scenario found in {test_file}. Skipping.")
-            continue
-        scenario_data = get_scenario_data(test_scenario, connection_details)
-        rows.append(
-            [
-                test_scenario.get("test_id", ""),
-                test_scenario.get("test_name", ""),
-                test_scenario.get("test_group", ""),
-                ", ".join(test_scenario.get("tags", [])),
-                test_scenario.get("description", ""),
-                check_scenario_connections(connection_details, connections),
-            ]
-        )
+            return None
+        get_scenario_data(test_scenario, connection_details)
+        return [
+            test_scenario.get("test_id", ""),
+            test_scenario.get("test_name", ""),
+            test_scenario.get("test_group", ""),
+            ", ".join(test_scenario.get("tags", [])),
+            test_scenario.get("description", ""),
+            check_scenario_connections(connection_details),
+        ]
+
+    rows = []
+    # Files and their nested scenarios are read on a thread pool; rows keep the input order.
+    with ThreadPoolExecutor() as pool:
+        for test_file, row in zip(test_files, pool.map(build_row, test_files)):
+            if row is None:
+                logger.error(f"❌ No test scenario found in {test_file}. Skipping.")
+                continue
+            rows.append(row)
     if logger:
-        logger.info("\n" + tabulate(rows, headers=headers, tablefmt="grid"))
+        logger.info("\n" + format_grid_table(rows, headers))
     else:
-        print("\n" + tabulate(rows, headers=headers, tablefmt="grid"))
+        print("\n" + format_grid_table(rows, headers))
     return rows
 
 
@@ -277,6 +488,9 @@ def discover_and_test_connections(
     Returns:
         Dict containing test results and statistics
     """
+    from system_connections.connection_factory import ConnectionFactory
+    from system_connections.connection_discovery import ConnectionDiscovery
+
     print("🔍 DISCOVERING ALL POSSIBLE CONNECTIONS...")
 
     # Create factory and discovery instance
@@ -321,57 +535,57 @@ def discover_and_test_connections(
 
 
 def calculate_connection_statistics(
-    test_results: List[Dict[str, Any]],
+    test_results: List["ConnResult"],
 ) -> Dict[str, Any]:
     """Calculate detailed statistics from test results"""
 
     if not test_results:
         return {}
 
-    # Basic counts
+    # Counts, per-type/per-name stats and timing gathered in one pass
     total = len(test_results)
-    success_count = len([r for r in test_results if r["status"] == "SUCCESS"])
-    partial_count = len([r for r in test_results if r["status"] == "PARTIAL"])
-    failed_count = len([r for r in test_results if r["status"] == "FAILED"])
-    error_count = len([r for r in test_results if r["status"] == "ERROR"])
-
-    # Statistics by connection type
+    status_counts = {"SUCCESS": 0, "PARTIAL": 0, "FAILED": 0, "ERROR": 0}
     type_stats = {}
-    for result in test_results:
-        conn_type = result["connection_type"]
-        if conn_type not in type_stats:
-            type_stats[conn_type] = {"total": 0, "success": 0, "failed": 0}
-
-        type_stats[conn_type]["total"] += 1
-        if result["status"] == "SUCCESS":
-            type_stats[conn_type]["success"] += 1
-        else:
-            type_stats[conn_type]["failed"] += 1
-
-    # Statistics by connection name
     name_stats = {}
+    timed_count = 0
+    time_sum = 0.0
+    min_time = max_time = 0
     for result in test_results:
-        conn_name = result["connection_name"]
-        if conn_name not in name_stats:
-            name_stats[conn_name] = {"total": 0, "success": 0, "failed": 0}
-
-        name_stats[conn_name]["total"] += 1
-        if result["status"] == "SUCCESS":
-            name_stats[conn_name]["success"] += 1
-        else:
-            name_stats[conn_name]["failed"] += 1
-
-    # Timing statistics (only for successful connections)
-    successful_results = [
-        r for r in test_results if r["status"] == "SUCCESS" and r["total_time"]
-    ]
-    if successful_results:
-        total_times = [r["total_time"] for r in successful_results]
-        avg_time = sum(total_times) / len(total_times)
-        min_time = min(total_times)
-        max_time = max(total_times)
-    else:
-        avg_time = min_time = max_time = 0
+        status = result.status
+        if status in status_counts:
+            status_counts[status] += 1
+        succeeded = status == "SUCCESS"
+
+        for stats, key in (
+            (type_stats, result.connection_type),
+            (name_stats, result.connection_name),
+        ):
+            entry = stats.get(key)
+            if entry is None:
+                entry = stats[key] = {"total": 0, "success": 0, "failed": 0}
+            entry["total"] += 1
+            if succeeded:
+                entry["success"] += 1
+            else:
+                entry["failed"] += 1
+
+        # Timing statistics (only for successful connections)
+        total_time = result.total_time if succeeded else None
+        if total_time:
+            if timed_count == 0:
+                min_time = max_time = total_time
+            elif total_time < min_time:
+                min_time = total_time
+            elif total_time > max_time:
+                max_time = total_time
+            time_sum += total_time
+            timed_count += 1
+
+    success_count = status_counts["SUCCESS"]
+    partial_count = status_counts["PARTIAL"]
+    failed_count = status_counts["FAILED"]
+    error_count = status_counts["ERROR"]
+    avg_time = time_sum / timed_count if timed_count else 0
 
     return {
         "summary": {
@@ -388,11 +602,27 @@ def calculate_connection_statistics(
             "avg_connection_time": avg_time,
             "min_connection_time": min_time,
             "max_connection_time": max_time,
-            "successful_connections": len(successful_results),
+            "successful_connections": timed_count,
         },
     }
 
 
+def _classify_path(path: str) -> str | None:
+    """
+    Classify a path with a single stat call.
+    Returns "dir", "file" or "other", or None if the path does not exist.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return None
+    if stat.S_ISDIR(mode):
+        return "dir"
+    if stat.S_ISREG(mode):
+        return "file"
+    return "other"
+
+
 def validate_schema(
     schema_type: str, schema_file: str, file_or_dir: str, logger: TestLogger
 ) -> bool:
@@ -421,33 +651,39 @@ def validate_schema(
             f"{schema_type}_schema.json",
         )
     )
-    if not os.path.exists(schema_file):
+    if _classify_path(schema_file) is None:
         logger.error(f"❌ Schema file not found: {schema_file}")
         return
-    if not os.path.exists(file_or_dir):
+    kind = _classify_path(file_or_dir)
+    if kind is None:
         logger.error(f"❌ File or directory not found: {file_or_dir}")
         return
-    if os.path.isdir(file_or_dir):
+    if kind == "dir":
         matched_files = discover_tests(file_or_dir, None, logger=logger)
         if not matched_files:
             logger.error(f"❌ No matching files found in directory: {file_or_dir}")
             return
     else:
         matched_files = [file_or_dir]
+    from schema_checker.schema_factory import ExecutorFactory
+
     factory = ExecutorFactory().get_instance(schema_file)
     executor = factory.get_executor(schema_type)
+    # One validator instance loads the schema once and is reused for every file.
+    schema_validator = executor(schema_file)
     for file_path in matched_files:
         logger.info(f"Validating {file_path} against {schema_type} schema...")
-        if not os.path.exists(file_path):
+        kind = _classify_path(file_path)
+        if kind is None:
             logger.error(f"❌ File not found: {file_path}")
             continue
-        if not os.path.isfile(file_path):
+        if kind != "file":
             logger.error(f"❌ Not a file: {file_path}")
             continue
-        if not file_path.endswith((".yaml", ".yml", ".json")):
+        if not file_path.endswith(TEST_FILE_EXTENSIONS):
             logger.error(f"❌ Unsupported file format: {file_path}")
             continue
-        executor(schema_file).validate_schema(file_path)
+        schema_validator.validate_schema(file_path)
 
 
 def main() -> None:
@@ -568,7 +804,7 @@ def main() -> None:
             logger.error(f"❌ Connection config file not found: {args.conn_config}")
             return
         # Load connection config if needed (not implemented in this snippet)
-    conn_config = json.load(open(args.conn_config, "r")) if args.conn_config else {}
+    conn_config = load_json_file(args.conn_config) if args.conn_config else {}
     if args.discover_connections:
         logger.info("Discovering and testing all connections...")
         results = discover_and_test_connections(
@@ -583,14 +819,25 @@ def main() -> None:
             )
             return
 
+    from system_connections.connection_factory import ConnectionFactory
+
     factory = ConnectionFactory.get_instance(conn_config)
 
     matched_files = discover_tests(test_dir, args, logger=logger)
     print(matched_files)
-    for file_path in matched_files:
-        run_test(file_path, workspace, logger=logger)
+    # Scenarios share the Context singleton and the global OCPTV writer, so they
+    # run one at a time; the files are parsed ahead on a background thread.
+    prefetch = ThreadPoolExecutor(max_workers=1)
+    try:
+        for file_path in matched_files:
+            prefetch.submit(load_yaml_file_cached, file_path)
+        for file_path in matched_files:
+            run_test(file_path, workspace, logger=logger)
+    finally:
+        # A failing run must not wait for the remaining files to be parsed.
+        prefetch.shutdown(wait=False, cancel_futures=True)
 
-    ConnectionFactory().close_all_connections()
+    factory.close_all_connections()
     logger.info("All tests executed successfully.")
 
 
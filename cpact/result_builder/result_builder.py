@@ -12,14 +12,20 @@ scenario validation and analysis.
 
 Features:
 - Collects step-level results including status, duration, and messages.
+- Stores step results column-wise (one list per field) to avoid a dict per step.
+- Can reserve column slots up front when the number of steps is known.
+- Exposes recorded steps as slotted, read-only StepResult records.
 - Tracks diagnostic codes and messages across test steps.
 - Supports context key-value storage for output analysis.
 - Provides tabular summaries of results and diagnostics.
 - Filters and merges diagnostic entries for uniqueness.
-- Exports results and diagnostics to JSON files.
-- Prints formatted tables using tabulate for readability.
+- Exports results and diagnostics to JSON files, optionally as compact streamed JSON.
+- Encodes compact exports with orjson when installed, falling back to streamed json.
+- Prints formatted tables using tabulate for readability, reusing the step table until results change.
 
 Classes:
+    StepResult:
+        Read-only record of a single step result.
     ResultCollector:
         Centralized result aggregation and reporting class.
         Designed for use across test execution workflows.
@@ -27,22 +33,85 @@ Classes:
 Usage:
     Use `ResultCollector.get_instance()` to retrieve the singleton.
     Call `add_step_result()` and `add_diagnostic()` to record results.
+    Call `finalize_step()` to record the final status of a step that was already added.
     Use `print_summary()` or `print_summary_table()` to display results.
     Use `dump_results()` or `dump_diagnostics()` to export data.
 ===========================================================================
 """
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 import copy
 import json
+import sys
 import threading
-from time import time
 from tabulate import tabulate
-import pprint
 import pandas as pd
-import textwrap
-from typing import Any, Type, List
+from typing import Any, Iterator, Type, List
 from utils.logger_utils import TestLogger
 
+try:
+    # C JSON encoder for the result exports; falls back to the standard library
+    import orjson
+except ImportError:
+    orjson = None
+
+# Values of these types are immutable, so they can be stored without copying.
+_IMMUTABLE_TYPES = (str, int, float, bool, type(None))
+
+# Step statuses reported as failures in the summary.
+_FAIL_STATUSES = frozenset({"FAIL", "fail", "error", "ERROR"})
+
+# Write buffer used when exporting results to JSON.
+DUMP_BUFFER_SIZE = 1 << 20
+
+
+def _orjson_dumps(data: Any) -> bytes:
+    """
+    Encodes data as compact JSON with orjson.
+    Args:
+        data (Any): The data to encode.
+    Returns:
+        bytes: The encoded JSON document.
+    """
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _intern(value: Any) -> Any:
+    """
+    Interns string values so repeated ids, types, statuses and codes share one object.
+    Args:
+        value (Any): The value to intern.
+    Returns:
+        Any: The interned string, or the value unchanged if it is not a string.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+# Fixed step result fields, in the order they appear in exported results.
+_STEP_COLUMNS = (
+    "scenario_id",
+    "step_id",
+    "step_name",
+    "step_type",
+    "status",
+    "duration",
+    "message",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class StepResult:
+    """Outcome of a single executed test step"""
+
+    scenario_id: Any
+    step_id: Any
+    step_name: Any
+    step_type: Any
+    status: Any
+    duration: float
+    message: Any = ""
+    extra: dict | None = None
+
 
 class ResultCollector:
     _instance = None # Singleton instance
@@ -54,6 +123,8 @@ class ResultCollector:
         Returns:
             None
         """
+        # Serializes writes to the column store; continued steps report from pool threads
+        self._steps_lock = threading.Lock()
         self.reset()
         self.logger = TestLogger().get_logger()
 
@@ -62,13 +133,17 @@ class ResultCollector:
         """
         Returns the singleton instance of ResultCollector.
         If the instance does not exist, it creates one in a thread-safe manner.
+        The lock is only taken while the instance has not been created yet.
         Returns:
             ResultCollector: The singleton instance of ResultCollector.
         """
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
-            if not cls._instance:
+            if cls._instance is None:
                 cls._instance = cls()
-        return cls._instance
+            return cls._instance
 
     def reset(self) -> None:
         """
@@ -76,11 +151,73 @@ class ResultCollector:
         Returns:
             None
         """
-        self.step_results = []  # Each step's result (status, duration, msg, etc.)
+        # Step results stored column-wise; "_extra" holds per-step kwargs (or None)
+        self._cols = {name: [] for name in _STEP_COLUMNS}
+        self._cols["_extra"] = []
+        self._size = 0  # Recorded steps; columns may hold reserved slots past this
+        self._steps_version = 0  # Bumped whenever a step result is added or changed
+        self._table_cache = (None, -1)  # (rendered summary table, version)
         self.keys_to_set = {}  # Key-value pairs from output analysis
         self.diagnostics = []  # All diagnostic matches
-        self.diagnostics_codes = []  # Diagnostic codes collected
-        self.step_index = {}  # Mapping: step_name -> index in step_results list
+        self._code_counter = Counter()  # Occurrences per diagnostic code
+        self._diag_version = 0  # Bumped whenever a diagnostic is added
+        self._diag_cache = (None, -1)  # (filtered diagnostics, version)
+        self.step_index = {}  # Mapping: step_id -> row index in the column store
+
+    @property
+    def step_results(self) -> List[dict]:
+        """
+        Builds the per-step result dictionaries from the column store.
+        Returns:
+            list: One dictionary per recorded step, including any extra fields.
+        """
+        return list(self._iter_step_results())
+
+    @property
+    def diagnostics_codes(self) -> List[str]:
+        """
+        Lists every collected diagnostic code once per occurrence, grouped by code.
+        Returns:
+            list: The diagnostic codes, built from the occurrence counter.
+        """
+        return list(self._code_counter.elements())
+
+    def _column(self, name: str) -> list:
+        """
+        Returns a column without the slots reserved by `preallocate()`.
+        Args:
+            name (str): The column name.
+        Returns:
+            list: The recorded values of the column.
+        """
+        column = self._cols[name]
+        return column if len(column) == self._size else column[: self._size]
+
+    def iter_steps(self) -> Iterator[StepResult]:
+        """
+        Yields the recorded step results as StepResult records.
+        Returns:
+            Iterator[StepResult]: Record for each recorded step, in execution order.
+        """
+        column = self._column
+        return map(
+            StepResult, *(column(name) for name in _STEP_COLUMNS), column("_extra")
+        )
+
+    def _iter_step_results(self) -> Iterator[dict]:
+        """
+        Yields the per-step result dictionaries one at a time.
+        Returns:
+            Iterator[dict]: Result dictionary for each recorded step.
+        """
+        column = self._column
+        for *values, extra in zip(
+            *(column(name) for name in _STEP_COLUMNS), column("_extra")
+        ):
+            row = dict(zip(_STEP_COLUMNS, values))
+            if extra:
+                row.update(extra)
+            yield row
 
     def add_step_result(
         self,
@@ -107,20 +244,51 @@ class ResultCollector:
         Returns:
             None
         """
-        result = {
-            "scenario_id": copy.deepcopy(scenario_id),
-            "step_id": copy.deepcopy(step_id),
-            "step_name": copy.deepcopy(step_name),
-            "step_type": copy.deepcopy(step_type),
-            "status": copy.deepcopy(status),
-            "duration": round(copy.deepcopy(duration), 3),
-            "message": copy.deepcopy(message),
-            # **kwargs
+        # Only mutable values (e.g. the details dict) need a private copy.
+        extra = {
+            k: v if type(v) in _IMMUTABLE_TYPES else copy.deepcopy(v)
+            for k, v in kwargs.items()
         }
-        for k, v in kwargs.items():
-            result[k] = copy.deepcopy(v)
-        self.step_index[step_id] = len(self.step_results)
-        self.step_results.append(result)
+        # Same order as the column store: _STEP_COLUMNS followed by "_extra"
+        values = (
+            _intern(scenario_id),
+            step_id,
+            step_name,
+            _intern(step_type),
+            _intern(status),
+            round(duration, 3),
+            message,
+            extra or None,
+        )
+        with self._steps_lock:
+            cols = self._cols
+            idx = self._size
+            if idx < len(cols["step_id"]):
+                # Fill a slot reserved by preallocate()
+                for column, value in zip(cols.values(), values):
+                    column[idx] = value
+            else:
+                for column, value in zip(cols.values(), values):
+                    column.append(value)
+            self._size = idx + 1
+            self._steps_version += 1
+            self.step_index[step_id] = idx
+
+    def preallocate(self, count: int) -> None:
+        """
+        Reserves slots for the next `count` step results, so recording them fills
+        existing list entries instead of growing every column.
+        Args:
+            count (int): The number of step results expected next.
+        Returns:
+            None
+        """
+        with self._steps_lock:
+            missing = self._size + count - len(self._cols["step_id"])
+            if missing > 0:
+                padding = [None] * missing
+                for column in self._cols.values():
+                    column.extend(padding)
 
     def update_step_result(self, step_id: str, **kwargs: dict) -> None:
         """
@@ -132,10 +300,42 @@ class ResultCollector:
             None
         """
         idx = self.step_index.get(step_id)
-        if idx is not None:
-            self.step_results[idx].update(kwargs)
-        else:
+        if idx is None:
+            raise ValueError(f"No result found for step '{step_id}'")
+        cols = self._cols
+        with self._steps_lock:
+            self._steps_version += 1
+            for k, v in kwargs.items():
+                if k in _STEP_COLUMNS:
+                    cols[k][idx] = v
+                else:
+                    if cols["_extra"][idx] is None:
+                        cols["_extra"][idx] = {}
+                    cols["_extra"][idx][k] = v
+
+    def finalize_step(
+        self, step_id: str, status: str, duration: float, message: str = ""
+    ) -> None:
+        """
+        Records the final status, duration and message of an existing step result.
+        Fast path for the common update; use `update_step_result()` for other fields.
+        Args:
+            step_id (str): The identifier for the step to be updated.
+            status (str): The final status of the step.
+            duration (float): The total duration of the step in seconds.
+            message (str): An optional message describing the outcome.
+        Returns:
+            None
+        """
+        idx = self.step_index.get(step_id)
+        if idx is None:
             raise ValueError(f"No result found for step '{step_id}'")
+        cols = self._cols
+        with self._steps_lock:
+            self._steps_version += 1
+            cols["status"][idx] = _intern(status)
+            cols["duration"][idx] = round(duration, 3)
+            cols["message"][idx] = message
 
     # def add_context_key(self, key, value):
     #     self.context_keys[key] = value
@@ -161,7 +361,9 @@ class ResultCollector:
                 "message": message,
             }
         )
-        self.diagnostics_codes.extend(codes)
+        # Pass the codes as an iterable: Counter.update() would add the values of a mapping.
+        self._code_counter.update(_intern(code) for code in codes)
+        self._diag_version += 1
 
     def add_diagnostic_keys(
         self, tc_id: str, step_id: str, key: str, value: object
@@ -211,15 +413,15 @@ class ResultCollector:
         Returns:
             None
         """
-        for r in self.step_results:
-            status_icon = (
-                "[PASS]"
-                if r["status"] not in ["FAIL", "fail", "error", "ERROR"]
-                else "[FAIL]"
-            )
-            self.logger.info(
-                f"{status_icon} Step: {r['step_name']} | Type: {r['step_type']} | Time: {r['duration']:.2f}s | Msg: {r.get('message', '')}"
+        # One log record per block instead of one per line
+        lines = []
+        for r in self.iter_steps():
+            status_icon = "[FAIL]" if r.status in _FAIL_STATUSES else "[PASS]"
+            lines.append(
+                f"{status_icon} Step: {r.step_name} | Type: {r.step_type} | Time: {r.duration:.2f}s | Msg: {r.message}"
             )
+        if lines:
+            self.logger.info("\n".join(lines))
 
         if self.diagnostics:
             self.logger.info("\n❌ Detected Diagnostic Issues:")
@@ -229,8 +431,9 @@ class ResultCollector:
             self.diagnostic_summary()
         if self.keys_to_set:
             self.logger.info("\n🔑 Final Context Keys:")
-            for k, v in self.keys_to_set.items():
-                self.logger.info(f"{k} = {v}")
+            self.logger.info(
+                "\n".join(f"{k} = {v}" for k, v in self.keys_to_set.items())
+            )
 
     def print_summary_table(self) -> None:
         """
@@ -238,23 +441,33 @@ class ResultCollector:
         Returns:
             None
         """
+        # Re-render only if a step result was added or changed since the last call
+        rendered, version = self._table_cache
+        if version == self._steps_version:
+            self.logger.info(rendered)
+            return
         headers = ["Step Name", "Type", "Status", "Duration (s)", "Message"]
-        table = []
-        for r in self.step_results:
-            table.append(
-                [
-                    r.get("step_name", ""),
-                    r.get("step_type", ""),
-                    r.get("status", ""),
-                    f"{r.get('duration', 0):.2f}",
-                    (
-                        self.shorten_string(r.get("message", ""), max_length=50)
-                        if r.get("message")
-                        else ""
-                    ),
-                ]
-            )
-        self.logger.info("\n" + tabulate(table, headers=headers, tablefmt="grid"))
+        column = self._column
+        df = pd.DataFrame(
+            {
+                "step_name": column("step_name"),
+                "step_type": column("step_type"),
+                "status": column("status"),
+                "duration": column("duration"),
+                "message": column("message"),
+            }
+        )
+        df["duration"] = df["duration"].map("{:.2f}".format)
+        # Truncate long messages with the vectorized string methods instead of
+        # calling shorten_string() per row.
+        message = df["message"].fillna("").astype(str)
+        df["message"] = message.where(
+            message.str.len() <= 50, message.str.slice(0, 47) + "..."
+        )
+        table = df.values.tolist()
+        rendered = "\n" + tabulate(table, headers=headers, tablefmt="grid")
+        self._table_cache = (rendered, self._steps_version)
+        self.logger.info(rendered)
 
     def shorten_string(self, text: str, max_length: int = 20) -> str:
         """
@@ -269,18 +482,42 @@ class ResultCollector:
             return text[: max_length - 3] + "..."
         return text
 
-    def dump_results(self, file_path: str) -> None:
+    def dump_results(self, file_path: str, indent: int | None = 4) -> None:
         """
         Save the complete results to a JSON file.
         Args:
             file_path (str): The path to the file where results should be saved.
+            indent (int | None): Indentation for pretty-printed output. Pass None to write
+                compact JSON, which is smaller and encoded much faster.
         Returns:
             None
         """
-        import json
-
-        with open(file_path, "w") as f:
-            json.dump(self.get_results(), f, indent=4)
+        # Indented output always goes through json so the layout honors `indent`
+        # whether or not orjson is installed; orjson only encodes compact output.
+        if indent is None and orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(_orjson_dumps(self.get_results()))
+            self.logger.info(f"Results saved to {file_path}")
+            return
+        with open(file_path, "w", buffering=DUMP_BUFFER_SIZE, encoding="utf-8") as f:
+            if indent is not None:
+                json.dump(self.get_results(), f, indent=indent)
+            else:
+                # Encode section by section, and steps row by row, so the step
+                # dictionaries are never all built at the same time. Non-ASCII text
+                # is written as UTF-8, as orjson does.
+                encode = json.JSONEncoder(
+                    separators=(",", ":"), ensure_ascii=False
+                ).encode
+                f.write(f'{{"diagnostic_codes":{encode(self.diagnostics_codes)}')
+                f.write(f',"diagnostics":{encode(self.diagnostics)}')
+                f.write(f',"keys":{encode(self.keys_to_set)}')
+                f.write(',"steps":[')
+                for i, row in enumerate(self._iter_step_results()):
+                    if i:
+                        f.write(",")
+                    f.write(encode(row))
+                f.write("]}")
         self.logger.info(f"Results saved to {file_path}")
 
     def dump_diagnostics(self, file_path: str) -> None:
@@ -291,8 +528,6 @@ class ResultCollector:
         Returns:
             None
         """
-        import json
-
         data = self.filter_unique_diagnostics(self.diagnostics)
         with open(file_path, "w") as f:
             json.dump(data, f, indent=4)
@@ -307,7 +542,8 @@ class ResultCollector:
             None
         """
         rows = []
-        all_columns = ["Diagnostic Code"]  # start with first column
+        # Insertion-ordered set of column headers; start with first column
+        columns = dict.fromkeys(["Diagnostic Code"])
 
         # Flatten data and dynamically track all column headers in insertion order
         for main_key, entries in diagnostic_data.items():
@@ -318,15 +554,13 @@ class ResultCollector:
                     if main_key in entry.values():
                         entry = {k: v for k, v in entry.items() if v != main_key}
                     flat_entry.update(entry)
+                    # Add new keys to columns dynamically
+                    columns.update(dict.fromkeys(entry))
                 rows.append(flat_entry)
-                # Add new keys to columns dynamically
-                if isinstance(entry, dict):
-                    for k in entry.keys():
-                        if k not in all_columns:
-                            all_columns.append(k)
-        # Convert rows to consistent list for tabulate
+        all_columns = list(columns)
+        # Convert rows to consistent list for tabulate, looking each cell up once
         table_data = [
-            [r.get(c, "") if r.get(c) is not None else "" for c in all_columns]
+            ["" if (value := r.get(c)) is None else value for c in all_columns]
             for r in rows
         ]
         if table_data:
@@ -356,13 +590,8 @@ class ResultCollector:
             self.logger.info("No diagnostics to summarize.")
             return
 
-        code_count = defaultdict(int)
-        for diag in self.diagnostics:
-            for code in diag.get("codes", []):
-                code_count[code] += 1
-
         self.logger.info("\n📊 Diagnostic Codes Summary:")
-        table = [[code, count] for code, count in code_count.items()]
+        table = [[code, count] for code, count in self._code_counter.most_common()]
         self.logger.info(
             "\n"
             + tabulate(
@@ -378,6 +607,11 @@ class ResultCollector:
         Returns:
             dict: A dictionary with unique diagnostic codes as keys and lists of associated entries as values.
         """
+        # Diagnostics are append-only, so the collector's own list only needs
+        # filtering again after a new entry was added.
+        own_data = diagnostic_data is self.diagnostics
+        if own_data and self._diag_cache[1] == self._diag_version:
+            return self._diag_cache[0]
         merged_codes = defaultdict(list)
         unique_tracker = defaultdict(set)
 
@@ -387,21 +621,23 @@ class ResultCollector:
                 for entry in entries:
                     if isinstance(entry, str) and entry.strip() == code:
                         continue
+                    # Filter dict entries once; the same dict is used for the
+                    # uniqueness key and as the stored entry.
                     if isinstance(entry, dict):
-                        mew_entry = {k: v for k, v in entry.items() if v != code}
-                        entry_tuple = tuple(sorted(mew_entry.items()))
+                        entry_data = {k: v for k, v in entry.items() if v != code}
+                        entry_key = frozenset(entry_data.items())
                     elif isinstance(entry, (list, tuple)):
-                        entry_tuple = tuple(entry)
+                        entry_data = entry
+                        entry_key = tuple(entry)
                     else:
-                        entry_tuple = (entry,)
-                    if entry_tuple not in unique_tracker[code]:
-                        unique_tracker[code].add(entry_tuple)
-                        entry_data = (
-                            {k: v for k, v in entry.items() if v != code}
-                            if isinstance(entry, dict)
-                            else entry
-                        )
+                        entry_data = entry
+                        entry_key = (entry,)
+                    seen = unique_tracker[code]
+                    if entry_key not in seen:
+                        seen.add(entry_key)
                         if entry_data:
                             merged_codes[code].append(entry_data)
         merged_codes = dict(merged_codes)
+        if own_data:
+            self._diag_cache = (merged_codes, self._diag_version)
         return merged_codes
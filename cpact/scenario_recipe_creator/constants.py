@@ -13,14 +13,19 @@ visual design across the application.
 
 Features:
 - `NumberedListWidget`: QListWidget with automatic numbering and drag-and-drop support.
+  Numbers are rendered by an item delegate rather than stored in the item text.
 - `ExpandingTextEdit`: QTextEdit that adjusts its height based on content.
 - `HoverPushButton`: QPushButton with hover animation for enhanced UX.
-- `MODERN_UI_QSS` and `TOOLBAR_QSS`: Qt stylesheet strings for modern UI theming.
+- `MODERN_UI_QSS` and `TOOLBAR_QSS`: Qt stylesheet strings for modern UI theming, minified at import.
 - Utility functions:
     - `enable_hidpi_and_fonts`: Enables high-DPI scaling and font rendering.
     - `add_card_shadows`: Applies drop shadows to widgets marked as 'card'.
+    - `make_card`: Creates a card group box with its drop shadow already applied.
     - `make_button`: Creates a styled button with role-based appearance.
+    - `set_button_roles`: Assigns roles to a batch of buttons with a single repolish each.
+    - `make_ok_cancel_box`: Creates the styled OK/Cancel button box wired to a dialog.
     - `show_error`: Displays a styled error message box.
+    - `compile_form_fields`: Compiles schema properties into cached `FieldSpec` form descriptors.
 
 Intended Use:
 This module is designed to be imported into PyQt5 applications that require consistent styling,
@@ -33,33 +38,47 @@ Dependencies:
 ===========================================================================
 """
 
-import os
-import glob
 import json
-import yaml
+import os
+import re
+from collections import namedtuple
+from functools import lru_cache
 from typing import Any
 from PyQt5.QtCore import (
     Qt,
     QTimer,
-    QRect,
+    QPoint,
     QPropertyAnimation,
+    QAbstractAnimation,
     QEasingCurve,
     QCoreApplication,
+    QEvent,
+    QObject,
 )
 from PyQt5.QtWidgets import (
     QWidget,
+    QListView,
     QListWidget,
     QListWidgetItem,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTextEdit,
     QPushButton,
     QGraphicsDropShadowEffect,
     QFrame,
+    QGroupBox,
     QMessageBox,
+    QDialog,
+    QDialogButtonBox,
 )
 
 ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
 APP_ICON = os.path.join(ICON_DIR, "scenario_designer.ico")
 
+# Card drop shadow parameters
+CARD_SHADOW_BLUR_RADIUS = 18
+CARD_SHADOW_OFFSET = (0, 6)
+
 MODERN_UI_QSS = r"""
 /* ===== Global ===== */
 * { outline: none; }
@@ -131,16 +150,6 @@ QPushButton:pressed {
     background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #e6f0ff, stop:1 #d0e4ff);
 }
 
-/* Primary */
-QPushButton[role="primary"] {
-    color: white;
-    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #6fb0ff, stop:1 #2f7fed);
-    border: 1px solid rgba(0,0,0,0.08);
-}
-QPushButton[role="primary"]:hover {
-    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #86c3ff, stop:1 #3d86ff);
-}
-
 /* Icon-only toolbutton */
 QToolButton.icon {
     border-radius: 6px;
@@ -203,19 +212,6 @@ QWidget:disabled { color: #9aaeb8; background: #f6f8fb; }
 
 /* ===== Role-based buttons ===== */
 
-/* Base button look (keeps things consistent) */
-QPushButton {
-    border-radius: 5px;
-    padding: 4px 8px;   /* smaller padding */
-    min-height: 20px;   /* was 25px */
-    font-size: 11px;    /* slightly smaller font */
-    font-weight: 600;
-    border: 1px solid rgba(0,0,0,0.08);
-    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,
-                                 stop:0 #fbfdff, stop:1 #eef6ff);
-    color: #0f2433;
-}
-
 /* Primary — blue */
 QPushButton[role="primary"] {
     color: white;
@@ -303,28 +299,61 @@ TOOLBAR_QSS = r"""
             }
         """
 
-# Constants
-ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons")
-APP_ICON = os.path.join(ICON_DIR, "scenario_designer.ico")
+
+def _minify_qss(qss: str) -> str:
+    """
+    Strips comments and redundant whitespace from a Qt stylesheet.
+
+    Args:
+        qss (str): The stylesheet source.
+
+    Returns:
+        str: The equivalent minified stylesheet.
+    """
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.S)
+    qss = re.sub(r"\s+", " ", qss)
+    return re.sub(r"\s*([{}:;,])\s*", r"\1", qss).strip()
+
+
+# Minify once at import so Qt's stylesheet parser scans fewer characters
+MODERN_UI_QSS = _minify_qss(MODERN_UI_QSS)
+TOOLBAR_QSS = _minify_qss(TOOLBAR_QSS)
 
 # -------------------------------
 # Custom Widgets
 # -------------------------------
 
 
+class _NumberedItemDelegate(QStyledItemDelegate):
+    """
+    Item delegate that displays each row's 1-based position in front of its text.
+    """
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: Any) -> None:
+        super().initStyleOption(option, index)
+        option.text = f"{index.row() + 1}. {option.text}"
+
+
 class NumberedListWidget(QListWidget):
     """
     QListWidget that automatically numbers its items and supports drag-and-drop reordering.
+    Numbers are drawn by the item delegate from the row position and are not stored in
+    the item text, so inserts, removals and moves never rewrite any item.
     """
 
     def __init__(self) -> None:
         super().__init__()
         self.setDragDropMode(QListWidget.InternalMove)
-        self.model().rowsMoved.connect(self.renumber_items)
+        self.setItemDelegate(_NumberedItemDelegate(self))
+        # Rows are single-line, so one size hint fits all; lay out in batches
+        self.setViewMode(QListView.ListMode)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setBatchSize(100)
 
     def add_item_with_number(self, text: str) -> None:
         """
-        Adds a new item to the list and renumbers all items.
+        Adds a new item to the end of the list; its number is shown by the delegate.
 
         Args:
             text (str): The text content of the new item.
@@ -332,15 +361,12 @@ class NumberedListWidget(QListWidget):
         item = QListWidgetItem()
         item.setText(text)
         self.addItem(item)
-        self.renumber_items()
 
     def renumber_items(self, *args: Any) -> None:
         """
-        Renumbers all items in the list to maintain sequential numbering.
+        Repaints the visible rows; numbers always follow the current row order.
         """
-        for i in range(self.count()):
-            item = self.item(i)
-            item.setText(f"{i + 1}. {item.text().split('. ', 1)[-1]}")
+        self.viewport().update()
 
 
 class ExpandingTextEdit(QTextEdit):
@@ -356,6 +382,7 @@ class ExpandingTextEdit(QTextEdit):
         This constructor sets up the minimum and maximum height for the text edit widget, configures
         line wrapping to fit the widget's width, disables the vertical scroll bar, 
         and connects the text change event to automatically adjust the widget's height. 
+        Height adjustments are debounced so a burst of keystrokes triggers a single resize.
         It also schedules an initial height adjustment after the widget is created.
         Args:
             min_height (int, optional): The minimum height of the text edit widget. Defaults to 60.
@@ -366,7 +393,7 @@ class ExpandingTextEdit(QTextEdit):
             - Calls the superclass constructor with any additional arguments.
             - Sets the minimum and maximum height attributes.
             - Configures line wrapping and disables the vertical scroll bar.
-            - Connects the textChanged signal to the adjust_height method.
+            - Connects the textChanged signal to a 50 ms single-shot timer that calls adjust_height.
             - Schedules an initial call to adjust_height after widget creation.
         Returns:
             None
@@ -378,7 +405,12 @@ class ExpandingTextEdit(QTextEdit):
 
         self.setLineWrapMode(QTextEdit.WidgetWidth)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.textChanged.connect(self.adjust_height)
+        self._last_doc_height = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self.adjust_height)
+        self.textChanged.connect(self._resize_timer.start)
         QTimer.singleShot(0, self.adjust_height)
 
     def adjust_height(self) -> None:
@@ -397,6 +429,7 @@ class ExpandingTextEdit(QTextEdit):
             None
         Body:
             - Calculates the document's height and adds a small padding.
+            - Returns early if the height is unchanged since the last adjustment.
             - Compares the calculated height with the widget's minimum and maximum height limits.
             - Sets the widget's height and vertical scroll bar policy accordingly.
         Returns:
@@ -404,6 +437,9 @@ class ExpandingTextEdit(QTextEdit):
 
         """
         doc_height = int(self.document().size().height()) + 10
+        if doc_height == self._last_doc_height:
+            return
+        self._last_doc_height = doc_height
 
         if doc_height <= self.min_height:
             self.setFixedHeight(self.min_height)
@@ -416,12 +452,28 @@ class ExpandingTextEdit(QTextEdit):
             self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
 
 
+def _reduced_motion() -> bool:
+    """
+    Checks whether the user or the application asked for UI animations to be skipped.
+
+    Returns:
+        bool: True if QT_REDUCED_MOTION is set to a non-zero value, or the application
+        has a truthy "reduced_motion" property.
+    """
+    if os.environ.get("QT_REDUCED_MOTION", "0") not in ("", "0"):
+        return True
+    app = QCoreApplication.instance()
+    return app is not None and bool(app.property("reduced_motion"))
+
+
 class HoverPushButton(QPushButton):
     """
     A QPushButton subclass that animates a "lift" effect when hovered.
     This button smoothly moves upward by a specified number of pixels when the mouse hovers over it,
     and returns to its original position when the mouse leaves. The animation duration and lift height
-    can be customized.
+    can be customized. All buttons share a single animation object, since only one button can
+    be hovered at a time. No animation runs when reduced motion is requested, either through the
+    QT_REDUCED_MOTION environment variable or a truthy "reduced_motion" application property.
     Arguments:
         *args: Positional arguments passed to the QPushButton constructor.
         lift_px (int, optional): Number of pixels to lift the button on hover. Default is 4.
@@ -442,37 +494,59 @@ class HoverPushButton(QPushButton):
                 None
     """
 
+    _anim = None  # Shared animation, created on first hover
 
     def __init__(self, *args: Any, lift_px: int = 4, anim_ms: int = 120, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._lift_px = lift_px
         self._anim_ms = anim_ms
-        self._anim = QPropertyAnimation(self, b"geometry")
-        self._anim.setEasingCurve(QEasingCurve.OutQuad)
-        self._orig_geom = None
+        self._orig_pos = None
+        self._animated = not _reduced_motion()
+
+    @classmethod
+    def _animation(cls) -> QPropertyAnimation:
+        """
+        Returns the animation shared by all hover buttons, creating it on first use.
+        Only the position is animated: unlike geometry, moving the button does not
+        resize it, so no layout pass runs on every animation frame.
+        """
+        if HoverPushButton._anim is None:
+            anim = QPropertyAnimation()
+            anim.setPropertyName(b"pos")
+            anim.setEasingCurve(QEasingCurve.OutQuad)
+            HoverPushButton._anim = anim
+        return HoverPushButton._anim
+
+    def _animate_to(self, target: QPoint) -> None:
+        """
+        Animates this button to the given position using the shared animation.
+        """
+        anim = self._animation()
+        if anim.state() == QAbstractAnimation.Running:
+            anim.stop()
+            previous = anim.targetObject()
+            if previous is not None and previous is not self:
+                # Finish the interrupted animation (e.g. a lowering button) at once
+                previous.move(anim.endValue())
+        anim.setTargetObject(self)
+        anim.setDuration(self._anim_ms)
+        anim.setStartValue(self.pos())
+        anim.setEndValue(target)
+        anim.start()
 
     def enterEvent(self, event: object) -> None:
-        if self._orig_geom is None:
-            self._orig_geom = self.geometry()
-        g = self.geometry()
-        target = QRect(g.x(), g.y() - self._lift_px, g.width(), g.height())
-        self._anim.stop()
-        self._anim.setDuration(self._anim_ms)
-        self._anim.setStartValue(g)
-        self._anim.setEndValue(target)
-        self._anim.start()
+        if not self._animated:
+            return super().enterEvent(event)
+        if self._orig_pos is None:
+            self._orig_pos = self.pos()
+        p = self.pos()
+        self._animate_to(QPoint(p.x(), p.y() - self._lift_px))
         super().enterEvent(event)
 
     def leaveEvent(self, event: object) -> None:
-        if self._orig_geom is None:
+        if not self._animated or self._orig_pos is None:
             return super().leaveEvent(event)
-        g = self.geometry()
-        target = self._orig_geom
-        self._anim.stop()
-        self._anim.setDuration(self._anim_ms)
-        self._anim.setStartValue(g)
-        self._anim.setEndValue(target)
-        self._anim.start()
+        self._animate_to(self._orig_pos)
         super().leaveEvent(event)
 
 
@@ -492,25 +566,75 @@ def enable_hidpi_and_fonts() -> None:
         pass
 
 
+class _ShadowVisibilityFilter(QObject):
+    """
+    Event filter that disables a card's drop shadow while the card is hidden,
+    so the blur is not computed for cards that are not on screen.
+    """
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        event_type = event.type()
+        if event_type == QEvent.Show or event_type == QEvent.Hide:
+            effect = obj.graphicsEffect()
+            if effect is not None:
+                effect.setEnabled(event_type == QEvent.Show)
+        return False
+
+
+_shadow_filter = None  # Shared _ShadowVisibilityFilter, created on first use
+
+
+def _apply_card_shadow(widget: QWidget) -> None:
+    """
+    Applies the card drop shadow to a widget.
+
+    Args:
+        widget (QWidget): The card widget.
+    """
+    global _shadow_filter
+    effect = QGraphicsDropShadowEffect(widget)
+    effect.setBlurRadius(CARD_SHADOW_BLUR_RADIUS)
+    effect.setColor(Qt.black)
+    effect.setOffset(*CARD_SHADOW_OFFSET)
+    widget.setGraphicsEffect(effect)
+    if _shadow_filter is None:
+        _shadow_filter = _ShadowVisibilityFilter()
+    widget.installEventFilter(_shadow_filter)
+
+
 def add_card_shadows(root_widget: QWidget) -> None:
     """
     Applies drop shadows to QFrame widgets marked as 'card'.
+    Prefer `make_card()` for new cards; it applies the shadow without a subtree scan.
+    Widgets that already have a graphics effect are left unchanged.
 
     Args:
         root_widget (QWidget): The root widget to search for card frames.
     """
-
-    def apply_shadow(widget: QFrame) -> None:
-        effect = QGraphicsDropShadowEffect(widget)
-        effect.setBlurRadius(18)
-        effect.setColor(Qt.black)
-        effect.setOffset(0, 6)
-        widget.setGraphicsEffect(effect)
-
     for widget in root_widget.findChildren(QFrame):
+        if widget.graphicsEffect() is not None:
+            continue
         name = widget.objectName().lower()
         if "card" in name or widget.property("card") is True:
-            apply_shadow(widget)
+            _apply_card_shadow(widget)
+
+
+def make_card(parent: QWidget = None, object_name: str = "card") -> QGroupBox:
+    """
+    Creates a group box marked as a card, with its drop shadow already applied.
+
+    Args:
+        parent (QWidget): Optional parent widget.
+        object_name (str): Object name of the card; should contain 'card'.
+
+    Returns:
+        QGroupBox: The card group box.
+    """
+    card = QGroupBox(parent)
+    card.setObjectName(object_name)
+    card.setProperty("card", True)
+    _apply_card_shadow(card)
+    return card
 
 
 def make_button(text: str, role: str = "primary", group: QWidget = None) -> QPushButton:
@@ -525,11 +649,58 @@ def make_button(text: str, role: str = "primary", group: QWidget = None) -> QPus
     Returns:
         QPushButton: The styled button.
     """
-    button = HoverPushButton(text, parent=group)
+    # Set the role before parenting so the stylesheet resolves it in one pass
+    button = HoverPushButton(text)
     button.setProperty("role", role)
+    if group is not None:
+        button.setParent(group)
     return button
 
 
+def set_button_roles(*buttons_and_roles: tuple[QPushButton, str]) -> None:
+    """
+    Sets the styling role on a batch of buttons and repolishes each one once.
+
+    Buttons that have not been polished yet pick up the role when first shown,
+    so only already-polished buttons are repolished.
+
+    Args:
+        *buttons_and_roles (tuple[QPushButton, str]): (button, role) pairs; None buttons are skipped.
+    """
+    polished = []
+    for button, role in buttons_and_roles:
+        if button is None:
+            continue
+        button.setProperty("role", role)
+        if button.testAttribute(Qt.WA_WState_Polished):
+            polished.append(button)
+    for button in polished:
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
+
+
+def make_ok_cancel_box(dialog: QDialog) -> tuple[QDialogButtonBox, QPushButton]:
+    """
+    Creates a styled OK/Cancel button box wired to a dialog's accept and reject slots.
+
+    Args:
+        dialog (QDialog): The dialog the buttons accept or reject.
+
+    Returns:
+        tuple[QDialogButtonBox, QPushButton]: The button box and its OK button.
+    """
+    buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+    ok_btn = buttons.button(QDialogButtonBox.Ok)
+    set_button_roles(
+        (ok_btn, "primary"),
+        (buttons.button(QDialogButtonBox.Cancel), "cancel"),
+    )
+    buttons.accepted.connect(dialog.accept)
+    buttons.rejected.connect(dialog.reject)
+    return buttons, ok_btn
+
+
 def show_error(parent: QWidget, text: str) -> int:
     """
     Displays a styled error message box with a red 'OK' button.
@@ -551,3 +722,58 @@ def show_error(parent: QWidget, text: str) -> int:
     msg.addButton(ok_btn, QMessageBox.AcceptRole)
 
     return msg.exec_()
+
+
+# Field kinds of a compiled schema form
+FIELD_ENUM = "enum"
+FIELD_BOOL = "bool"
+FIELD_TEXT = "text"
+
+FieldSpec = namedtuple("FieldSpec", "key kind label enum required")
+
+
+@lru_cache(maxsize=32)
+def _compile_form_fields(schema_json: str) -> tuple:
+    """
+    Builds the field descriptors for a JSON-encoded `[properties, required]` pair.
+
+    Args:
+        schema_json (str): JSON dump of the schema properties and required list.
+
+    Returns:
+        tuple: A tuple of `FieldSpec` entries in property order.
+    """
+    properties, required = json.loads(schema_json)
+    required = frozenset(required)
+    fields = []
+    for key, prop in properties.items():
+        if prop.get("type") == "string" and "enum" in prop:
+            kind, enum = FIELD_ENUM, tuple(prop["enum"])
+        elif prop.get("type") == "boolean":
+            kind, enum = FIELD_BOOL, None
+        else:
+            kind, enum = FIELD_TEXT, None
+        is_required = key in required
+        if is_required:
+            label = f"<b>{key}</b> <span style='color:red'>*</span>"
+        else:
+            label = key
+        fields.append(FieldSpec(key, kind, label, enum, is_required))
+    return tuple(fields)
+
+
+def compile_form_fields(properties: dict, required: list = None) -> tuple:
+    """
+    Compiles schema properties into form field descriptors, cached per schema.
+
+    Args:
+        properties (dict): The `properties` mapping of the schema.
+        required (list | frozenset): Names of the required properties.
+
+    Returns:
+        tuple: A tuple of `FieldSpec(key, kind, label, enum, required)` entries, where
+        `kind` is one of `FIELD_ENUM`, `FIELD_BOOL` or `FIELD_TEXT`.
+    """
+    return _compile_form_fields(
+        json.dumps([properties or {}, sorted(required or ())], default=str)
+    )
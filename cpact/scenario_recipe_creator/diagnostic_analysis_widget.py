@@ -30,17 +30,52 @@ Usage:
     Call `result()` to retrieve the structured output.
 ===========================================================================
 """
+import json
+from functools import lru_cache
+
 from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget,
     QLineEdit,
     QComboBox,
-    QDialogButtonBox,
     QDialog,
     QFormLayout,
     QCheckBox,
-    QGroupBox,
 )
+from constants import make_card, make_ok_cancel_box
+
+_MISSING = object()
+
+# Field kinds of the compiled schema
+_STRING_ENUM = 0
+_BOOLEAN = 1
+_STRING = 2
+
+
+@lru_cache(maxsize=8)
+def _compile_schema(variants_json: str) -> tuple:
+    """
+    Compiles the `oneOf` variants into a flat, reusable field descriptor.
+
+    Args:
+        variants_json (str): JSON dump of the schema's `oneOf` list, used as the cache key.
+
+    Returns:
+        tuple: One `(required, fields)` pair per variant, where `required` is a frozenset
+        and `fields` is a tuple of `(key, kind, enum_values)` entries.
+    """
+    compiled = []
+    for item in json.loads(variants_json):
+        fields = []
+        for key, prop in item.get("properties", {}).items():
+            if prop.get("type") == "string" and "enum" in prop:
+                fields.append((key, _STRING_ENUM, tuple(prop["enum"])))
+            elif prop.get("type") == "boolean":
+                fields.append((key, _BOOLEAN, None))
+            else:
+                fields.append((key, _STRING, None))
+        compiled.append((frozenset(item.get("required", [])), tuple(fields)))
+    return tuple(compiled)
 
 
 class DiagnosticAnalysisDialog(QDialog):
@@ -64,9 +99,14 @@ class DiagnosticAnalysisDialog(QDialog):
         self.diagnostic_schema = diagnostic_schema or {}
         self.diagnostic_list = diagnostic_schema.get("oneOf", [])
         self.diagnostic_data = {}
+        # (getter, setter) per field, chosen once for the widget type
+        self._accessors = {}
         self.required = diagnostic_schema.get("required", [])
+        # Normalizer for the data shape, fixed by the first load
+        self._load_strategy = None
         self.build_ui()
         if data:
+            self._load_strategy = self._select_load_strategy(data)
             self.load(data)
 
     def build_ui(self) -> None:
@@ -79,117 +119,154 @@ class DiagnosticAnalysisDialog(QDialog):
         Returns:
             None
         """
+        # Coalesce the per-row layout invalidations into a single pass
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
         layout = QVBoxLayout()
         form = QFormLayout()
-        idx = 0
-        for item in self.diagnostic_list:
-            d_group = QGroupBox()
-            d_group.setObjectName(
-                "steps_card"
-            )  # have 'card' in the objectName so the shadow helper picks it up
-            d_group.setProperty("card", True)
+        variants = _compile_schema(json.dumps(self.diagnostic_list))
+        for idx, (required, fields) in enumerate(variants):
+            d_group = make_card(object_name="steps_card")
+            # Populated detached; attached to the card once all rows are added
             d_form = QFormLayout()
             self.diagnostic_data[idx] = {}
-            for key, prop in item.get("properties", {}).items():
-                self.required = item.get("required", [])
-                label = f"{key} *" if key in self.required else key
-                if key in self.required:
+            accessors = self._accessors[idx] = {}
+            for key, kind, enum_values in fields:
+                if key in required:
                     label = f"<b>{key}</b> <span style='color:red'>*</span>"
-                if prop.get("type") == "string" and "enum" in prop:
+                else:
+                    label = key
+                if kind == _STRING_ENUM:
                     combo = QComboBox()
-                    combo.addItems(prop["enum"])
-                    setattr(self, key, combo)
+                    combo.addItems(list(enum_values))
                     self.diagnostic_data[idx][key] = combo
+                    accessors[key] = (combo.currentText, combo.setCurrentText)
                     d_form.addRow(label, combo)
-                elif prop.get("type") == "boolean":
+                elif kind == _BOOLEAN:
                     checkbox = QCheckBox()
-
                     self.diagnostic_data[idx][key] = checkbox
-                    setattr(self, key, checkbox)
+                    accessors[key] = (
+                        checkbox.isChecked,
+                        lambda value, box=checkbox: box.setChecked(bool(value)),
+                    )
                     d_form.addRow(label, checkbox)
                 else:
                     line_edit = QLineEdit()
-                    setattr(self, key, line_edit)
                     self.diagnostic_data[idx][key] = line_edit
+                    accessors[key] = (line_edit.text, line_edit.setText)
                     d_form.addRow(label, line_edit)
-            idx += 1
             d_group.setLayout(d_form)
             layout.addWidget(d_group)
 
         layout.addLayout(form)
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        ok_btn = buttons.button(QDialogButtonBox.Ok)
-        if ok_btn:
-            ok_btn.setProperty("role", "primary")
-
-        cancel_btn = buttons.button(QDialogButtonBox.Cancel)
-        if cancel_btn:
-            cancel_btn.setProperty("role", "cancel")
-
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
+        buttons, _ = make_ok_cancel_box(self)
         layout.addWidget(buttons)
         self.setLayout(layout)
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
 
-    def load(self, d: dict) -> None:
+    def _select_load_strategy(self, d: dict | list):
         """
-        Loads diagnostic analysis data into the form widgets.
+        Picks the normalizer matching the shape of the diagnostic data.
 
         Args:
-        d (dict): A dictionary containing diagnostic data mapped by index and field name.
+            d (dict | list): Diagnostic data as a single dict or a list of dicts.
 
         Returns:
-        None
-        """
-         # Normalize the input into a dict with keys 0 and 1
-        normalized_data = {}
+            Callable: `_load_from_list` or `_load_from_dict`.
 
-        # --- Case 1: List of dicts ---
+        Raises:
+            ValueError: If the data is neither a dict nor a list.
+        """
         if isinstance(d, list):
-            for i, item in enumerate(d):
-                if i in self.diagnostic_data and isinstance(item, dict):
-                    matched_fields = {}
-                    for key, widget in self.diagnostic_data[i].items():
-                        for k, v in item.items():
-                            if k == key or k.endswith(key) or key.endswith(k):
-                                matched_fields[key] = v
-                                break
-                    normalized_data[i] = matched_fields
-
-        # --- Case 2: Single dict ---
-        elif isinstance(d, dict):
-            # Find which diagnostic_data index has the most matching keys
-            best_idx = None
-            max_matches = 0
-
-            for idx, field_map in self.diagnostic_data.items():
-                match_count = sum(1 for k in d if k in field_map)
-                if match_count > max_matches:
-                    max_matches = match_count
-                    best_idx = idx
-
-            # Assign all matching fields to that best index
-            if best_idx is not None:
+            return self._load_from_list
+        if isinstance(d, dict):
+            return self._load_from_dict
+        raise ValueError("Invalid input: expected dict or list of dicts")
+
+    def _load_from_list(self, d: list) -> dict:
+        """
+        Normalizes a list of dicts, one per schema variant, into per-index field values.
+
+        Args:
+            d (list): Diagnostic data as a list of dicts.
+
+        Returns:
+            dict: Matched field values keyed by variant index.
+        """
+        normalized_data = {}
+        for i, item in enumerate(d):
+            if i in self.diagnostic_data and isinstance(item, dict):
                 matched_fields = {}
-                for key in self.diagnostic_data[best_idx]:
-                    if key in d:
-                        matched_fields[key] = d[key]
-                normalized_data[best_idx] = matched_fields
+                for key in self.diagnostic_data[i]:
+                    # Exact key match is a dict lookup; only scan for a
+                    # suffix match (e.g. "code" / "result_code") when it misses
+                    value = item.get(key, _MISSING)
+                    if value is _MISSING:
+                        value = next(
+                            (
+                                v
+                                for k, v in item.items()
+                                if k.endswith(key) or key.endswith(k)
+                            ),
+                            _MISSING,
+                        )
+                    if value is not _MISSING:
+                        matched_fields[key] = value
+                normalized_data[i] = matched_fields
+        return normalized_data
+
+    def _load_from_dict(self, d: dict) -> dict:
+        """
+        Normalizes a single dict by assigning it to the variant with the most matching keys.
+
+        Args:
+            d (dict): Diagnostic data as a single dict.
+
+        Returns:
+            dict: Matched field values keyed by variant index.
+        """
+        normalized_data = {}
+        # Find which diagnostic_data index has the most matching keys
+        best_idx = None
+        max_matches = 0
+
+        for idx, field_map in self.diagnostic_data.items():
+            match_count = sum(1 for k in d if k in field_map)
+            if match_count > max_matches:
+                max_matches = match_count
+                best_idx = idx
 
-        else:
-            raise ValueError("Invalid input: expected dict or list of dicts")
+        # Assign all matching fields to that best index
+        if best_idx is not None:
+            matched_fields = {}
+            for key in self.diagnostic_data[best_idx]:
+                if key in d:
+                    matched_fields[key] = d[key]
+            normalized_data[best_idx] = matched_fields
+        return normalized_data
+
+    def load(self, d: dict | list) -> None:
+        """
+        Loads diagnostic analysis data into the form widgets.
+
+        The normalizer is chosen from the shape of the first data loaded and reused afterwards.
+
+        Args:
+        d (dict | list): Diagnostic data as a single dict or a list of dicts.
+
+        Returns:
+        None
+        """
+        if self._load_strategy is None:
+            self._load_strategy = self._select_load_strategy(d)
+        normalized_data = self._load_strategy(d)
 
         # --- Apply to widgets ---
-        for idx, fields in self.diagnostic_data.items():
+        for idx, accessors in self._accessors.items():
             row_data = normalized_data.get(idx, {})
-            for key, widget in fields.items():
-                value = row_data.get(key, "")
-                if isinstance(widget, QLineEdit):
-                    widget.setText(value)
-                elif isinstance(widget, QComboBox):
-                    widget.setCurrentText(value)
-                elif isinstance(widget, QCheckBox):
-                    widget.setChecked(bool(value))
+            for key, (_, setter) in accessors.items():
+                setter(row_data.get(key, ""))
 
     def result(self) -> list:
         """
@@ -202,15 +279,7 @@ class DiagnosticAnalysisDialog(QDialog):
             list: A list of dictionaries containing field values for each diagnostic variant.
         """
 
-        results = []
-        for idx, fields in self.diagnostic_data.items():
-            row_data = {}
-            for key, widget in fields.items():
-                if isinstance(widget, QLineEdit):
-                    row_data[key] = widget.text()
-                elif isinstance(widget, QComboBox):
-                    row_data[key] = widget.currentText()
-                elif isinstance(widget, QCheckBox):
-                    row_data[key] = widget.isChecked()
-            results.append(row_data)
-        return results
+        return [
+            {key: getter() for key, (getter, _) in accessors.items()}
+            for accessors in self._accessors.values()
+        ]
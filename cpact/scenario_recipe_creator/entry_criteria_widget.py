@@ -16,13 +16,15 @@ Features:
 - Integrates with ExpandingTextEdit for adaptive multiline text input.
 - Supports loading existing entry criteria data into the form.
 - Automatically triggers form submission when preloaded data is present.
+- `fast_result` returns the auto-submitted entry without creating any widgets.
 - Returns structured user input as a dictionary.
+- Form building, loading and result collection are shared through SchemaFormDialog.
 
 Attributes:
     data (dict): Preloaded entry criteria data to populate the form.
     entry_criteria_schema (dict): JSON schema defining the structure of entry criteria.
     entry_criteria_data (dict): Stores widget references for each schema field.
-    required (list): List of required fields for the entry criteria.
+    required (frozenset): Required fields for the entry criteria.
     load_entry_criteria_data (dict): Optional data to preload and auto-submit.
 
 Usage:
@@ -31,26 +33,18 @@ Usage:
     Call `result()` to retrieve the structured output.
 ===============================================================================
 """
-from PyQt5.QtWidgets import (
-    QVBoxLayout,
-    QLineEdit,
-    QComboBox,
-    QWidget,
-    QDialogButtonBox,
-    QDialog,
-    QFormLayout,
-    QCheckBox,
-    QTextEdit,
-)
 
-from PyQt5.QtCore import QTimer
-from PyQt5.QtGui import QFontMetrics
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget
 
 from constants import ExpandingTextEdit
+from schema_form_dialog import SchemaFormDialog
 
 
-class EntryCriteriaDialog(QDialog):
+class EntryCriteriaDialog(SchemaFormDialog):
+    text_widget_cls = ExpandingTextEdit
+    field_store_attr = "entry_criteria_data"
+    adjust_text_height = True
+
     def __init__(
         self,
         parent: QWidget = None,
@@ -70,107 +64,35 @@ class EntryCriteriaDialog(QDialog):
         Returns:
             None
         """
-        super().__init__(parent)
-        self.setWindowTitle("Add / Edit Entry Criteria")
-        self.setFixedSize(500, 300)
-        self.data = data or {}
-        self.entry_criteria_schema = (
-            entry_criteria_schema.get("items", {}).get("properties", {}) or {}
+        items = entry_criteria_schema.get("items", {})
+        super().__init__(
+            parent,
+            items.get("properties", {}) or {},
+            items.get("required", []),
+            title="Add / Edit Entry Criteria",
+            size=(500, 300),
+            data=data,
+            load_data=load_entry_criteria_data,
         )
-        self.entry_criteria_data = {}
+        self.entry_criteria_schema = items.get("properties", {}) or {}
         self.load_entry_criteria_data = load_entry_criteria_data
-        self.required = entry_criteria_schema.get("items", {}).get("required", [])
-        self.build_ui()
-        if data:
-            self.load(data)
-
-    def build_ui(self) -> None:
-        """
-        Builds the entry criteria form layout dynamically based on the provided schema.
-
-        Args:
-            self (EntryCriteriaDialog): The instance of the entry criteria dialog class.
-
-        Returns:
-            None
-        """
-        layout = QVBoxLayout()
-        form = QFormLayout()
-        for key, prop in self.entry_criteria_schema.items():
-            label = f"{key} *" if key in self.required else key
-            if key in self.required:
-                label = f"<b>{key}</b> <span style='color:red'>*</span>"
-            if prop.get("type") == "string" and "enum" in prop:
-                combo = QComboBox()
-                combo.addItems(prop["enum"])
-                setattr(self, key, combo)
-                self.entry_criteria_data[key] = combo
-                form.addRow(label, combo)
-            elif prop.get("type") == "boolean":
-                checkbox = QCheckBox()
-                self.entry_criteria_data[key] = checkbox
-                setattr(self, key, checkbox)
-                form.addRow(label, checkbox)
-            else:
-                line_edit = ExpandingTextEdit()
-                setattr(self, key, line_edit)
-                self.entry_criteria_data[key] = line_edit
-                form.addRow(label, line_edit)
-                line_edit.adjust_height()
-
-        layout.addLayout(form)
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        ok_btn = buttons.button(QDialogButtonBox.Ok)
-        if ok_btn:
-            ok_btn.setProperty("role", "primary")
-
-        cancel_btn = buttons.button(QDialogButtonBox.Cancel)
-        if cancel_btn:
-            cancel_btn.setProperty("role", "cancel")
 
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
-        self.setLayout(layout)
-        if self.load_entry_criteria_data:
-            self.load(self.load_entry_criteria_data)
-            QTimer.singleShot(0, ok_btn.click)
-
-    def load(self, d: dict) -> None:
+    @classmethod
+    def fast_result(
+        cls, entry_criteria_schema: dict, load_entry_criteria_data: dict
+    ) -> dict | None:
         """
-        Loads entry criteria data into the corresponding form widgets.
+        Returns the auto-submitted entry criteria for the given data without building the dialog.
 
         Args:
-            d (dict): A dictionary containing entry criteria field values keyed by property name.
-
-        Returns:
-            None
-        """
-        for key, widget in self.entry_criteria_data.items():
-            if key in d:
-                if isinstance(widget, ExpandingTextEdit):
-                    widget.setPlainText(d[key])
-                elif isinstance(widget, QComboBox):
-                    widget.setCurrentText(d[key])
-                elif isinstance(widget, QCheckBox):
-                    widget.setChecked(bool(d[key]))
-
-    def result(self) -> dict:
-        """
-        Collects and returns entry criteria data from the form widgets.
-
-        Args:
-            self (EntryCriteriaDialog): The instance of the entry criteria dialog class.
+            entry_criteria_schema (dict): JSON schema defining the structure of entry criteria entries.
+            load_entry_criteria_data (dict): Entry criteria field values keyed by property name.
 
         Returns:
-            dict: A dictionary containing field values keyed by property name.
+            dict | None: Field values keyed by property name, or None when a value does
+            not fit its widget and the dialog has to be built instead.
         """
-        data = {}
-        for key, widget in self.entry_criteria_data.items():
-            if isinstance(widget, ExpandingTextEdit):
-                data[key] = widget.toPlainText()
-            elif isinstance(widget, QComboBox):
-                data[key] = widget.currentText()
-            elif isinstance(widget, QCheckBox):
-                data[key] = widget.isChecked()
-        return data
+        items = entry_criteria_schema.get("items", {})
+        return cls.headless_result(
+            items.get("properties", {}) or {}, load_entry_criteria_data
+        )
@@ -16,13 +16,14 @@ Features:
 - Integrates with ExpandingTextEdit for adaptive multiline text input.
 - Supports loading existing output analysis data into the form.
 - Returns structured user input as a dictionary.
+- Form building, loading and result collection are shared through SchemaFormDialog.
 
 Attributes:
     data (dict): Preloaded output analysis data to populate the form.
     output_analysis_schema (dict): JSON schema defining the structure of output analysis entries.
     output_analysis_properties (dict): Extracted properties from the schema.
     output_analysis_data (dict): Stores widget references for each schema field.
-    required (list): List of required fields for the output analysis entry.
+    required (frozenset): Required fields for the output analysis entry.
 
 Usage:
     Instantiate OutputAnalysisDialog with a schema and optional data.
@@ -31,20 +32,16 @@ Usage:
 ===============================================================================
 """
 
-from PyQt5.QtWidgets import (
-    QVBoxLayout,
-    QLineEdit,
-    QComboBox,
-    QDialogButtonBox,
-    QDialog,
-    QWidget,
-    QFormLayout,
-    QCheckBox,
-)
+from PyQt5.QtWidgets import QWidget
+
 from constants import ExpandingTextEdit
+from schema_form_dialog import SchemaFormDialog
+
 
+class OutputAnalysisDialog(SchemaFormDialog):
+    text_widget_cls = ExpandingTextEdit
+    field_store_attr = "output_analysis_data"
 
-class OutputAnalysisDialog(QDialog):
     def __init__(
         self,
         parent: QWidget = None,
@@ -62,103 +59,14 @@ class OutputAnalysisDialog(QDialog):
         Returns:
             None
         """
-        super().__init__(parent)
-        self.setWindowTitle("Add / Edit Output Analysis")
-        self.setFixedSize(400, 300)
-        self.data = data or {}
-        self.output_analysis_schema = output_analysis_schema or {}
-        self.output_analysis_properties = self.output_analysis_schema.get(
-            "properties", {}
+        output_analysis_schema = output_analysis_schema or {}
+        super().__init__(
+            parent,
+            output_analysis_schema.get("properties", {}),
+            output_analysis_schema.get("required", []),
+            title="Add / Edit Output Analysis",
+            size=(400, 300),
+            data=data,
         )
-        self.output_analysis_data = {}
-        self.required = self.output_analysis_schema.get("required", [])
-        self.build_ui()
-        if data:
-            self.load(data)
-
-    def build_ui(self) -> None:
-        """
-        Builds the output analysis form layout dynamically based on the provided schema.
-
-        Args:
-            self (OutputAnalysisDialog): The instance of the output analysis dialog class.
-
-        Returns:
-            None
-        """
-        layout = QVBoxLayout()
-        form = QFormLayout()
-        for key, prop in self.output_analysis_properties.items():
-            label = key
-            if key in self.required:
-                label = f"<b>{key}</b> <span style='color:red'>*</span>"
-            if prop.get("type") == "string" and "enum" in prop:
-                combo = QComboBox()
-                combo.addItems(prop["enum"])
-                setattr(self, key, combo)
-                self.output_analysis_data[key] = combo
-                form.addRow(label, combo)
-            elif prop.get("type") == "boolean":
-                checkbox = QCheckBox()
-                self.output_analysis_data[key] = checkbox
-                setattr(self, key, checkbox)
-                form.addRow(label, checkbox)
-            else:
-                line_edit = ExpandingTextEdit()
-                setattr(self, key, line_edit)
-                self.output_analysis_data[key] = line_edit
-                form.addRow(label, line_edit)
-
-        layout.addLayout(form)
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        ok_btn = buttons.button(QDialogButtonBox.Ok)
-        if ok_btn:
-            ok_btn.setProperty("role", "primary")
-
-        cancel_btn = buttons.button(QDialogButtonBox.Cancel)
-        if cancel_btn:
-            cancel_btn.setProperty("role", "cancel")
-
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
-        self.setLayout(layout)
-
-    def load(self, d: dict) -> None:
-        """
-        Loads output analysis data into the corresponding form widgets.
-
-        Args:
-            d (dict): A dictionary containing output analysis field values keyed by property name.
-
-        Returns:
-            None
-        """
-        for key, widget in self.output_analysis_data.items():
-            if key in d:
-                if isinstance(widget, ExpandingTextEdit):
-                    widget.setPlainText(d[key])
-                elif isinstance(widget, QComboBox):
-                    widget.setCurrentText(d[key])
-                elif isinstance(widget, QCheckBox):
-                    widget.setChecked(bool(d[key]))
-
-    def result(self) -> dict:
-        """
-        Collects and returns user input from the form as a dictionary.
-
-        Args:
-            self (OutputAnalysisDialog): The instance of the output analysis dialog class.
-
-        Returns:
-            dict: A dictionary containing output analysis field values keyed by property name.
-        """
-        data = {}
-        for key, widget in self.output_analysis_data.items():
-            if isinstance(widget, ExpandingTextEdit):
-                data[key] = widget.toPlainText()
-            elif isinstance(widget, QComboBox):
-                data[key] = widget.currentText()
-            elif isinstance(widget, QCheckBox):
-                data[key] = widget.isChecked()
-        return data
+        self.output_analysis_schema = output_analysis_schema
+        self.output_analysis_properties = output_analysis_schema.get("properties", {})
@@ -516,8 +516,8 @@ class RecipeCreator(QMainWindow):
             self._scenario_fields.append((key, edit))
             self._scenario_info_layout.addLayout(row)
 
-            if scenario_data:
-                self._update_scenario_fields(scenario_schema, scenario_data)
+        if scenario_data:
+            self._update_scenario_fields(scenario_schema, scenario_data)
 
     def _update_scenario_fields(
         self, scenario_schema: Dict[str, Any], scenario_data: Dict[str, Any]
@@ -600,23 +600,30 @@ class RecipeCreator(QMainWindow):
             None
         """
 
-        dialog = DockerDialog(
-            self, docker_schema=docker_schema, load_docker_data=docker_data
-        )
         required_fields = docker_schema.get("required", [])
 
-        if dialog.exec_() == QDialog.Accepted:
-            d = dialog.result()
-            if not all(d.get(f) for f in required_fields):
-                show_error(self, f'All fields required: {", ".join(required_fields)}')
+        d = None
+        if docker_data:
+            # Preloaded entries would auto-submit, so skip building the dialog
+            d = DockerDialog.fast_result(docker_schema, docker_data)
+        if d is None:
+            dialog = DockerDialog(
+                self, docker_schema=docker_schema, load_docker_data=docker_data
+            )
+            if dialog.exec_() != QDialog.Accepted:
                 return
+            d = dialog.result()
 
-            name_key = required_fields[0] if required_fields else "container_name"
-            title = d.get(name_key, "container_name")
-            item = QListWidgetItem(title)
-            item.setData(Qt.UserRole, d)
-            self._docker_list.addItem(item)
-            self._docker_container_list.append(d)
+        if not all(d.get(f) for f in required_fields):
+            show_error(self, f'All fields required: {", ".join(required_fields)}')
+            return
+
+        name_key = required_fields[0] if required_fields else "container_name"
+        title = d.get(name_key, "container_name")
+        item = QListWidgetItem(title)
+        item.setData(Qt.UserRole, d)
+        self._docker_list.addItem(item)
+        self._docker_container_list.append(d)
 
     def _edit_docker(self, docker_schema: Dict[str, Any]) -> None:
         """
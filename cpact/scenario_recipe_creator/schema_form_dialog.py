@@ -0,0 +1,265 @@
+"""
+Copyright (c) 2025 Open Compute Project
+Licensed under the MIT License.
+
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+
+===============================================================================
+SchemaFormDialog is the shared PyQt5 base dialog for flat, schema-driven forms. It builds
+a single QFormLayout from the `properties` of a JSON schema, with a combo box for
+enumerated strings, a checkbox for booleans and a configurable text widget otherwise.
+
+Features:
+- Builds the form from cached `FieldSpec` descriptors (see `compile_form_fields`).
+- Highlights required fields with styled labels.
+- Resolves each field's getter and setter once, when the field is built.
+- Optionally preloads data and auto-submits the dialog.
+- `headless_result` computes the auto-submitted result without building any widgets.
+
+Attributes:
+    data (dict): Preloaded data to populate the form.
+    required (frozenset): Required fields, for constant-time membership checks.
+    form_data (dict): Stores widget references for each schema field; also exposed
+        under the subclass's `field_store_attr` name.
+
+Usage:
+    Subclass SchemaFormDialog, set `text_widget_cls` and `field_store_attr`, and pass
+    the schema properties and required list to `__init__`.
+    Call `result()` to retrieve the structured output.
+===============================================================================
+"""
+
+from PyQt5.QtWidgets import (
+    QVBoxLayout,
+    QLineEdit,
+    QComboBox,
+    QDialog,
+    QWidget,
+    QFormLayout,
+    QCheckBox,
+    QTextEdit,
+)
+from PyQt5.QtCore import QSignalBlocker, QTimer
+
+from constants import (
+    FIELD_BOOL,
+    FIELD_ENUM,
+    ExpandingTextEdit,
+    compile_form_fields,
+    make_ok_cancel_box,
+)
+
+# Value accessors keyed by exact widget type, resolved once per field at build time
+_GETTERS = {
+    QLineEdit: QLineEdit.text,
+    QComboBox: QComboBox.currentText,
+    QCheckBox: QCheckBox.isChecked,
+    ExpandingTextEdit: ExpandingTextEdit.toPlainText,
+}
+_SETTERS = {
+    QLineEdit: QLineEdit.setText,
+    QComboBox: QComboBox.setCurrentText,
+    QCheckBox: lambda widget, value: widget.setChecked(bool(value)),
+    ExpandingTextEdit: ExpandingTextEdit.setPlainText,
+}
+# Characters QTextEdit.setPlainText converts; "\r\n" is collapsed to "\n" first
+_PLAIN_TEXT_TRANSLATION = str.maketrans(
+    {"\r": "\n", "\u2028": "\n", "\u2029": "\n", "\xa0": " "}
+)
+
+
+class SchemaFormDialog(QDialog):
+    # Widget used for fields that are neither enums nor booleans
+    text_widget_cls = QLineEdit
+    # Attribute name under which the field widget map is also exposed
+    field_store_attr = "form_data"
+    # Whether text widgets are resized to their content once added
+    adjust_text_height = False
+
+    def __init__(
+        self,
+        parent: QWidget = None,
+        properties: dict = None,
+        required: list = None,
+        *,
+        title: str,
+        size: tuple = (400, 300),
+        data: dict = None,
+        load_data: dict = None,
+    ) -> None:
+        """
+        Initializes the dialog and builds the form from the schema properties.
+
+        Args:
+            parent (QWidget): The parent widget for the dialog.
+            properties (dict): The `properties` mapping of the schema.
+            required (list): Names of the required properties.
+            title (str): Window title of the dialog.
+            size (tuple): Fixed (width, height) of the dialog.
+            data (dict): Preloaded data to populate the form.
+            load_data (dict): Optional data to preload and auto-submit.
+
+        Returns:
+            None
+        """
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setFixedSize(*size)
+        self.data = data or {}
+        self.required = frozenset(required or ())
+        self.form_data = {}
+        setattr(self, self.field_store_attr, self.form_data)
+        # (widget, getter, setter) per field
+        self._accessors = {}
+        self._load_data = load_data
+        self._fields = compile_form_fields(properties, self.required)
+        self.build_ui()
+        if data:
+            self.setUpdatesEnabled(False)
+            self.load(data)
+            self.setUpdatesEnabled(True)
+
+    def build_ui(self) -> None:
+        """
+        Builds the form layout from the compiled schema fields.
+
+        Args:
+            self (SchemaFormDialog): The instance of the dialog class.
+
+        Returns:
+            None
+        """
+        # Coalesce the per-row layout invalidations into a single pass
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        layout = QVBoxLayout()
+        form = QFormLayout()
+        text_edits = []
+        for key, kind, label, enum, _ in self._fields:
+            if kind == FIELD_ENUM:
+                combo = QComboBox()
+                combo.addItems(list(enum))
+                self._add_field(form, key, label, combo)
+            elif kind == FIELD_BOOL:
+                self._add_field(form, key, label, QCheckBox())
+            else:
+                text_edit = self.text_widget_cls()
+                self._add_field(form, key, label, text_edit)
+                text_edits.append(text_edit)
+        if self.adjust_text_height:
+            for text_edit in text_edits:
+                text_edit.adjust_height()
+
+        layout.addLayout(form)
+        buttons, ok_btn = make_ok_cancel_box(self)
+        layout.addWidget(buttons)
+        self.setLayout(layout)
+        if self._load_data:
+            self.load(self._load_data)
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.updateGeometry()
+        if self._load_data:
+            QTimer.singleShot(0, ok_btn.click)
+
+    def _add_field(
+        self, form: QFormLayout, key: str, label: str, widget: QWidget
+    ) -> None:
+        """
+        Registers a field widget with its value accessors and adds it to the form.
+
+        Args:
+            form (QFormLayout): The form layout receiving the row.
+            key (str): Property name of the field.
+            label (str): Row label, possibly rich text.
+            widget (QWidget): The input widget of the field.
+
+        Returns:
+            None
+        """
+        widget_type = type(widget)
+        self.form_data[key] = widget
+        self._accessors[key] = (widget, _GETTERS[widget_type], _SETTERS[widget_type])
+        form.addRow(label, widget)
+
+    def load(self, d: dict) -> None:
+        """
+        Loads field values into the corresponding form widgets.
+
+        Args:
+            d (dict): A dictionary containing field values keyed by property name.
+
+        Returns:
+            None
+        """
+        # Setting values programmatically must not notify listeners field by field
+        resized = []
+        for key, (widget, _, setter) in self._accessors.items():
+            if key in d:
+                with QSignalBlocker(widget):
+                    setter(widget, d[key])
+                if isinstance(widget, ExpandingTextEdit):
+                    resized.append(widget)
+        # ExpandingTextEdit resizes on textChanged, which was blocked above
+        for text_edit in resized:
+            text_edit.adjust_height()
+
+    @classmethod
+    def headless_result(cls, properties: dict, load_data: dict) -> dict | None:
+        """
+        Computes what `result()` returns after auto-submitting `load_data`, without Qt widgets.
+
+        Mirrors the widget setters and getters: text and enum widgets only accept strings
+        (None loads as empty text), enum values outside the enum keep the first option,
+        booleans are cast with `bool()`, and missing fields keep the widget defaults.
+        For QTextEdit-based text widgets, CR, CRLF and Unicode line separators become
+        newlines and non-breaking spaces become spaces, as `toPlainText()` returns them.
+
+        Args:
+            properties (dict): The `properties` mapping of the schema.
+            load_data (dict): Field values keyed by property name.
+
+        Returns:
+            dict | None: Field values keyed by property name, or None when a value is not
+            of the type its widget accepts; callers then build the dialog instead.
+        """
+        data = {}
+        plain_text = issubclass(cls.text_widget_cls, QTextEdit)
+        for key, kind, _, enum, _ in compile_form_fields(properties):
+            if kind == FIELD_BOOL:
+                data[key] = bool(load_data.get(key))
+                continue
+            default = (enum[0] if enum else "") if kind == FIELD_ENUM else ""
+            if key not in load_data:
+                data[key] = default
+                continue
+            value = load_data[key]
+            if value is None:
+                value = ""
+            elif not isinstance(value, str):
+                return None
+            if kind == FIELD_ENUM:
+                data[key] = value if value in enum else default
+            elif plain_text:
+                data[key] = value.replace("\r\n", "\n").translate(
+                    _PLAIN_TEXT_TRANSLATION
+                )
+            else:
+                data[key] = value
+        return data
+
+    def result(self) -> dict:
+        """
+        Collects and returns the form values.
+
+        Args:
+            self (SchemaFormDialog): The instance of the dialog class.
+
+        Returns:
+            dict: A dictionary containing field values keyed by property name.
+        """
+        return {
+            key: getter(widget)
+            for key, (widget, getter, _) in self._accessors.items()
+        }
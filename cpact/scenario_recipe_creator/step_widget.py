@@ -51,7 +51,6 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QListWidget,
     QListWidgetItem,
-    QDialogButtonBox,
     QDialog,
     QFormLayout,
     QCheckBox,
@@ -60,7 +59,7 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 
-from constants import make_button, show_error
+from constants import make_button, make_ok_cancel_box, show_error
 from diagnostic_analysis_widget import DiagnosticAnalysisDialog
 from output_analysis_widget import OutputAnalysisDialog
 from entry_criteria_widget import EntryCriteriaDialog
@@ -210,17 +209,7 @@ class StepDialog(QDialog):
         scroll.setWidget(self.dynamic_container)
         self.layout.addWidget(scroll)
 
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        ok_btn = buttons.button(QDialogButtonBox.Ok)
-        if ok_btn:
-            ok_btn.setProperty("role", "primary")
-
-        cancel_btn = buttons.button(QDialogButtonBox.Cancel)
-        if cancel_btn:
-            cancel_btn.setProperty("role", "cancel")
-
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
+        buttons, ok_btn = make_ok_cancel_box(self)
         self.layout.addWidget(buttons)
         self.setLayout(self.layout)
 
@@ -243,23 +232,27 @@ class StepDialog(QDialog):
         Returns:
             None
         """
-        dialog = EntryCriteriaDialog(
-            self,
-            entry_criteria_schema=entry_criteria_schema,
-            load_entry_criteria_data=item_data,
-        )
-        if dialog.exec_() == QDialog.Accepted:
-            d = dialog.result()
-            keys = list(
-                entry_criteria_schema.get("items", {}).get("required", {}) or []
+        d = None
+        if item_data:
+            # Preloaded entries would auto-submit, so skip building the dialog
+            d = EntryCriteriaDialog.fast_result(entry_criteria_schema, item_data)
+        if d is None:
+            dialog = EntryCriteriaDialog(
+                self,
+                entry_criteria_schema=entry_criteria_schema,
+                load_entry_criteria_data=item_data,
             )
-            if not all(k in d and d.get(k) for k in keys):
-                show_error(self, f'All fields required: {", ".join(keys)}')
+            if dialog.exec_() != QDialog.Accepted:
                 return
-            name = f"{d.get(keys[0], '')}" if keys else "Item-"
-            item = QListWidgetItem(name)
-            item.setData(Qt.UserRole, d)
-            self.ec_list.addItem(item)
+            d = dialog.result()
+        keys = list(entry_criteria_schema.get("items", {}).get("required", {}) or [])
+        if not all(k in d and d.get(k) for k in keys):
+            show_error(self, f'All fields required: {", ".join(keys)}')
+            return
+        name = f"{d.get(keys[0], '')}" if keys else "Item-"
+        item = QListWidgetItem(name)
+        item.setData(Qt.UserRole, d)
+        self.ec_list.addItem(item)
 
     def edit_entry_criteria(self, entry_criteria_schema: dict = None) -> None:
         item = self.ec_list.currentItem()
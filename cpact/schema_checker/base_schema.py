@@ -14,6 +14,7 @@ Features:
 - Loads schema files from JSON or YAML formats.
 - Automatically detects schema type based on file extension.
 - Provides a unified interface for schema validation.
+- Shares one compiled validator per distinct schema across instances.
 - Designed to be extended by specific schema validator implementations.
 - Integrates with TestLogger for structured logging.
 
@@ -31,9 +32,13 @@ Usage:
 import json
 import yaml
 from abc import ABC, abstractmethod
+from jsonschema import Draft7Validator
 
 from utils.logger_utils import TestLogger
 
+# Validators shared by all schema instances, keyed by the canonical JSON of the schema.
+_VALIDATORS: dict[str, Draft7Validator] = {}
+
 
 class BaseSchema(ABC):
     """
@@ -51,6 +56,7 @@ class BaseSchema(ABC):
         """
         self.schema = self.load_schema(schema)
         self.logger = TestLogger().get_logger()
+        self._validator = None
 
     def load_file(self, file_name: str) -> dict:
         """
@@ -78,6 +84,20 @@ class BaseSchema(ABC):
             self.logger.error("Unsupported schema file format.")
             return schema_file
 
+    def get_validator(self) -> Draft7Validator:
+        """
+        Return the Draft7Validator for this schema, building it only once per distinct schema.
+        The validator is also kept on the instance, so repeated calls skip the cache lookup.
+        :return: Validator for the loaded schema.
+        """
+        if self._validator is None:
+            key = json.dumps(self.schema, sort_keys=True)
+            validator = _VALIDATORS.get(key)
+            if validator is None:
+                validator = _VALIDATORS[key] = Draft7Validator(self.schema)
+            self._validator = validator
+        return self._validator
+
     def check_schema_type(self, schema_file: str) -> str:
         """
         Check the schema file type based on its extension.
@@ -27,8 +27,6 @@ Usage:
 ===============================================================================
 """
 
-from jsonschema import Draft7Validator
-
 from schema_checker.base_schema import BaseSchema
 
 
@@ -43,7 +41,7 @@ class ConfigSchemaValidator(BaseSchema):
         :return: None
         """
         data = self.load_schema(data_file)
-        validator = Draft7Validator(self.schema)
+        validator = self.get_validator()
         errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
 
         if not errors:
@@ -27,7 +27,6 @@ Usage:
     Use `scan_duplicates()` to detect duplicate keys before parsing.
 ===============================================================================
 """
-from jsonschema import Draft7Validator
 from collections import defaultdict
 from ruamel.yaml import YAML
 
@@ -116,7 +115,7 @@ class ScenarioSchemaValidator(BaseSchema):
             return
 
         # Validate the data against the schema
-        validator = Draft7Validator(self.schema)
+        validator = self.get_validator()
         errors = sorted(validator.iter_errors(data), key=lambda e: e.path)
 
         if not errors:
@@ -14,10 +14,13 @@ Features:
 - Discovers valid connection name/type combinations from configuration.
 - Validates connection readiness and command execution.
 - Supports SSH, Redfish, and local connection types.
-- Provides detailed test results including timing, status, and error messages.
+- Provides detailed test results including timing, status, and error messages
+  as slotted ConnResult records.
 - Prints formatted connection test summaries and exports results to CSV.
 
 Classes:
+    ConnResult:
+        Immutable result of testing one connection combination.
     ConnectionDiscovery:
         Uses a ConnectionFactory to discover and test all configured connections.
         Supports tunnel-aware logic for NodeManager connections.
@@ -31,12 +34,28 @@ Usage:
 ===============================================================================
 """
 import time
-from typing import Dict, Any, List
+from dataclasses import asdict, dataclass
+from typing import Dict, Any, List, Optional
 
 from system_connections.connection_factory import ConnectionFactory
 from system_connections.base_connection import ConnectionInterface
 
 
+@dataclass(frozen=True, slots=True)
+class ConnResult:
+    """Outcome of testing a single connection name/type combination"""
+
+    connection_name: str
+    connection_type: str
+    description: str
+    status: str
+    error: Optional[str]
+    connect_time: Optional[float]
+    command_time: Optional[float]
+    total_time: Optional[float]
+    details: str
+
+
 class ConnectionDiscovery:
     """Discover and test all possible connections from configuration"""
 
@@ -151,7 +170,7 @@ class ConnectionDiscovery:
 
         return f"{conn_type.upper()} connection to {connection_name}"
 
-    def test_all_connections(self, timeout: int = 10) -> List[Dict[str, Any]]:
+    def test_all_connections(self, timeout: int = 10) -> List[ConnResult]:
         """Test connectivity for all discovered connections"""
         discovery_result = self.discover_all_connections()
         test_results = []
@@ -179,7 +198,7 @@ class ConnectionDiscovery:
 
     def _test_single_connection(
         self, connection_name: str, connection_type: str, description: str, timeout: int
-    ) -> Dict[str, Any]:
+    ) -> ConnResult:
         """Test a single connection"""
         start_time = time.time()
 
@@ -195,17 +214,17 @@ class ConnectionDiscovery:
 
             if not connect_success:
                 connection.disconnect()
-                return {
-                    "connection_name": connection_name,
-                    "connection_type": connection_type,
-                    "description": description,
-                    "status": "FAILED",
-                    "error": "Connection failed",
-                    "connect_time": connect_time,
-                    "command_time": None,
-                    "total_time": connect_time,
-                    "details": "Unable to establish connection",
-                }
+                return ConnResult(
+                    connection_name=connection_name,
+                    connection_type=connection_type,
+                    description=description,
+                    status="FAILED",
+                    error="Connection failed",
+                    connect_time=connect_time,
+                    command_time=None,
+                    total_time=connect_time,
+                    details="Unable to establish connection",
+                )
 
             # Test command execution
             cmd_start_time = time.time()
@@ -220,43 +239,43 @@ class ConnectionDiscovery:
             connection.disconnect()
 
             if command_result["success"]:
-                return {
-                    "connection_name": connection_name,
-                    "connection_type": connection_type,
-                    "description": description,
-                    "status": "SUCCESS",
-                    "error": None,
-                    "connect_time": connect_time,
-                    "command_time": command_time,
-                    "total_time": total_time,
-                    "details": f"Command output: {command_result.get('output', '')[:50]}...",
-                }
+                return ConnResult(
+                    connection_name=connection_name,
+                    connection_type=connection_type,
+                    description=description,
+                    status="SUCCESS",
+                    error=None,
+                    connect_time=connect_time,
+                    command_time=command_time,
+                    total_time=total_time,
+                    details=f"Command output: {command_result.get('output', '')[:50]}...",
+                )
             else:
-                return {
-                    "connection_name": connection_name,
-                    "connection_type": connection_type,
-                    "description": description,
-                    "status": "PARTIAL",
-                    "error": command_result.get("error", "Command execution failed"),
-                    "connect_time": connect_time,
-                    "command_time": command_time,
-                    "total_time": total_time,
-                    "details": "Connection successful but command failed",
-                }
+                return ConnResult(
+                    connection_name=connection_name,
+                    connection_type=connection_type,
+                    description=description,
+                    status="PARTIAL",
+                    error=command_result.get("error", "Command execution failed"),
+                    connect_time=connect_time,
+                    command_time=command_time,
+                    total_time=total_time,
+                    details="Connection successful but command failed",
+                )
 
         except Exception as e:
             total_time = time.time() - start_time
-            return {
-                "connection_name": connection_name,
-                "connection_type": connection_type,
-                "description": description,
-                "status": "ERROR",
-                "error": str(e),
-                "connect_time": None,
-                "command_time": None,
-                "total_time": total_time,
-                "details": f"Exception during testing: {type(e).__name__}",
-            }
+            return ConnResult(
+                connection_name=connection_name,
+                connection_type=connection_type,
+                description=description,
+                status="ERROR",
+                error=str(e),
+                connect_time=None,
+                command_time=None,
+                total_time=total_time,
+                details=f"Exception during testing: {type(e).__name__}",
+            )
 
     def _execute_test_command(
         self, connection: ConnectionInterface, connection_type: str, timeout: int
@@ -301,7 +320,7 @@ class ConnectionDiscovery:
         except Exception as e:
             return {"success": False, "output": "", "error": str(e)}
 
-    def print_connection_table(self, test_results: List[Dict[str, Any]]) -> None:
+    def print_connection_table(self, test_results: List[ConnResult]) -> None:
         """Print connection test results in a formatted table"""
 
         # Print header
@@ -317,28 +336,28 @@ class ConnectionDiscovery:
         # Sort results by status (SUCCESS, PARTIAL, FAILED, ERROR)
         status_order = {"SUCCESS": 1, "PARTIAL": 2, "FAILED": 3, "ERROR": 4}
         sorted_results = sorted(
-            test_results, key=lambda x: status_order.get(x["status"], 5)
+            test_results, key=lambda x: status_order.get(x.status, 5)
         )
 
         # Print results
         for result in sorted_results:
-            connection = result["connection_name"][:14]
-            conn_type = result["connection_type"][:7]
-            status = result["status"][:7]
+            connection = result.connection_name[:14]
+            conn_type = result.connection_type[:7]
+            status = result.status[:7]
 
             # Format timing
             connect_time = (
-                f"{result['connect_time']:.2f}s" if result["connect_time"] else "N/A"
+                f"{result.connect_time:.2f}s" if result.connect_time else "N/A"
             )
             command_time = (
-                f"{result['command_time']:.2f}s" if result["command_time"] else "N/A"
+                f"{result.command_time:.2f}s" if result.command_time else "N/A"
             )
             total_time = (
-                f"{result['total_time']:.2f}s" if result["total_time"] else "N/A"
+                f"{result.total_time:.2f}s" if result.total_time else "N/A"
             )
 
-            description = result["description"][:34]
-            details = result["details"][:24] if result["details"] else ""
+            description = result.description[:34]
+            details = result.details[:24] if result.details else ""
 
             # Color coding for status
             status_symbol = {
@@ -356,10 +375,10 @@ class ConnectionDiscovery:
 
         # Calculate statistics
         total_tests = len(test_results)
-        successful = len([r for r in test_results if r["status"] == "SUCCESS"])
-        partial = len([r for r in test_results if r["status"] == "PARTIAL"])
-        failed = len([r for r in test_results if r["status"] == "FAILED"])
-        errors = len([r for r in test_results if r["status"] == "ERROR"])
+        successful = len([r for r in test_results if r.status == "SUCCESS"])
+        partial = len([r for r in test_results if r.status == "PARTIAL"])
+        failed = len([r for r in test_results if r.status == "FAILED"])
+        errors = len([r for r in test_results if r.status == "ERROR"])
 
         print(
             f"SUMMARY: Total: {total_tests} | ✅ Success: {successful} | ⚠️  Partial: {partial} | ❌ Failed: {failed} | 💥 Error: {errors}"
@@ -372,7 +391,7 @@ class ConnectionDiscovery:
 
     def export_results_to_csv(
         self,
-        test_results: List[Dict[str, Any]],
+        test_results: List[ConnResult],
         filename: str = "connection_test_results.csv",
     ) -> bool:
         """Export test results to CSV file"""
@@ -395,7 +414,7 @@ class ConnectionDiscovery:
 
                 writer.writeheader()
                 for result in test_results:
-                    writer.writerow(result)
+                    writer.writerow(asdict(result))
 
             print(f"\n📄 Results exported to: {filename}")
             return True
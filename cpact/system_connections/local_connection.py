@@ -12,6 +12,7 @@ background execution modes, file transfer simulation, and task lifecycle managem
 
 Features:
 - Executes shell commands locally with support for synchronous and background modes.
+- Runs simple commands directly from an argv list, skipping the intermediate shell.
 - Supports sudo execution with password injection on Unix/Linux systems.
 - Simulates file upload and download operations using local paths.
 - Tracks task status, output, and execution time.
@@ -34,6 +35,7 @@ Usage:
 import os
 import time
 import uuid
+import shlex
 import queue
 import platform
 import threading
@@ -51,6 +53,9 @@ from system_connections.constants import (
 )
 import shutil
 
+# Characters that require /bin/sh to interpret the command line.
+_SHELL_METACHARS = frozenset("|&;<>()$`\\*?[]#~=%{}!\n")
+
 
 class LocalConnection(ConnectionInterface):
     def __init__(self, config: Dict[str, Any] = None) -> None:
@@ -123,8 +128,37 @@ class LocalConnection(ConnectionInterface):
             # Unix/Linux handling
             if is_sudo and sudo_password:
                 return ["sudo", "-S"] + command.split(), False
-            else:
-                return command, True
+            argv = self._split_simple_command(command)
+            if argv is not None:
+                return argv, False
+            return command, True
+
+    def _split_simple_command(self, command: str) -> Optional[List[str]]:
+        """
+        Split a command that needs no shell features into an argv list.
+
+        Running the argv list with shell=False starts the program directly, without
+        the intermediate /bin/sh process that shell=True spawns. The executable is
+        resolved to an absolute path up front so unknown programs and builtins can
+        fall back to the shell.
+
+        Returns:
+            The argv list, or None when the command must go through the shell.
+        """
+        if any(ch in _SHELL_METACHARS for ch in command):
+            return None
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return None
+        if not argv:
+            return None
+        executable = shutil.which(argv[0])
+        if not executable:
+            # Shell builtins and unknown programs keep the shell path.
+            return None
+        argv[0] = executable
+        return argv
 
     def execute_command(
         self,
@@ -165,7 +199,9 @@ class LocalConnection(ConnectionInterface):
         prepared_command, use_shell = self._prepare_command(
             actual_command, is_sudo_command, sudo_password
         )
-        print(f"Prepared command: {prepared_command}, use_shell: {use_shell}")
+        self.logger.debug(
+            f"Prepared command: {prepared_command}, use_shell: {use_shell}"
+        )
 
         if mode == ExecutionMode.SYNCHRONOUS:
             return self._execute_synchronous(
@@ -175,11 +211,17 @@ class LocalConnection(ConnectionInterface):
                 use_shell,
                 is_sudo_command,
                 sudo_password,
+                display_command=command,
             )
 
         elif mode == ExecutionMode.BACKGROUND:
             self._execute_background(
-                task_id, prepared_command, use_shell, is_sudo_command, sudo_password
+                task_id,
+                prepared_command,
+                use_shell,
+                is_sudo_command,
+                sudo_password,
+                display_command=command,
             )
             if wait and timeout is not None:
                 # Wait for the specified timeout, then return result
@@ -195,7 +237,12 @@ class LocalConnection(ConnectionInterface):
 
         elif mode == ExecutionMode.BACKGROUND_WAIT:
             self._execute_background(
-                task_id, prepared_command, use_shell, is_sudo_command, sudo_password
+                task_id,
+                prepared_command,
+                use_shell,
+                is_sudo_command,
+                sudo_password,
+                display_command=command,
             )
             # Always wait for completion in this mode
             return self.wait_for_task(task_id, timeout)
@@ -208,12 +255,18 @@ class LocalConnection(ConnectionInterface):
         shell: bool,
         is_sudo: bool = False,
         sudo_password: Optional[str] = None,
+        display_command: Optional[str] = None,
     ) -> TaskResult:
-        """Execute command synchronously and return result immediately."""
+        """
+        Execute command synchronously and return result immediately.
+
+        `command` may be a prepared argv list; `display_command` is the original
+        command string reported in the TaskResult.
+        """
         start_time = time.time()
         result = TaskResult(
             task_id=task_id,
-            command=command,
+            command=display_command if display_command is not None else command,
             status=TaskStatus.RUNNING,
             start_time=start_time,
         )
@@ -222,7 +275,7 @@ class LocalConnection(ConnectionInterface):
             if is_sudo and sudo_password:
                 # Handle sudo commands properly
                 process = subprocess.Popen(
-                    ["sudo", "-S"] + command.split(),
+                    command,  # command is already prepared as list for sudo
                     stdin=subprocess.PIPE,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
@@ -300,8 +353,16 @@ class LocalConnection(ConnectionInterface):
         shell: bool,
         is_sudo: bool = False,
         sudo_password: Optional[str] = None,
+        display_command: Optional[str] = None,
     ) -> None:
-        """Execute command in background thread."""
+        """
+        Execute command in background thread.
+
+        `command` may be a prepared argv list; `display_command` is the original
+        command string used for logs and the task result.
+        """
+        if display_command is None:
+            display_command = str(command)
         try:
             if is_sudo and sudo_password and not self.is_windows:
                 # Handle sudo commands on Unix/Linux
@@ -325,23 +386,23 @@ class LocalConnection(ConnectionInterface):
 
             thread = threading.Thread(
                 target=self._background_worker,
-                args=(task_id, str(command), process, is_sudo, sudo_password),
+                args=(task_id, display_command, process, is_sudo, sudo_password),
                 daemon=True,
             )
 
-            background_task = BackgroundTask(task_id, str(command), process, thread)
+            background_task = BackgroundTask(task_id, display_command, process, thread)
 
             with self.lock:
                 self.background_tasks[task_id] = background_task
 
             thread.start()
-            self.logger.info(f"Started background task {task_id}: {command}")
+            self.logger.info(f"Started background task {task_id}: {display_command}")
 
         except Exception as e:
             self.logger.error(f"Failed to start background task {task_id}: {e}")
             result = TaskResult(
                 task_id=task_id,
-                command=str(command),
+                command=display_command,
                 status=TaskStatus.FAILED,
                 stderr=str(e),
                 return_code=-1,
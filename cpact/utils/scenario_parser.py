@@ -13,22 +13,93 @@ detection and error handling for invalid or unsupported file types.
 Features:
 - Loads YAML or JSON files into Python dictionaries or lists.
 - Automatically detects file extension and parses accordingly.
+- Uses the libyaml C loader when available, falling back to the pure-Python SafeLoader with a warning.
 - Converts YAML files to JSON format with optional output directory.
+- Caches parsed scenarios in a bounded LRU keyed by path, mtime and size, as read-only structures.
+- Keeps a JSON copy of parsed YAML files on disk, keyed by their mtime and size, so unchanged
+  files skip YAML parsing.
+- Uses orjson for JSON files and the JSON copies when installed, falling back to the json module.
+- Constructs only a requested top-level subtree when the rest of the file is not needed.
+- Reads scenario metadata (id, name, group, tags, description) without building the test steps.
 - Raises descriptive errors for missing files or malformed content.
 
 Attributes:
-    None (module-level functions only)
+    HAS_LIBYAML (bool): Whether YAML files are parsed with the libyaml C loader.
+    SCENARIO_CACHE_MAXSIZE (int): Maximum number of parsed files kept by `load_yaml_file_cached()`.
+    SCENARIO_JSON_CACHE_DIR (str): Directory holding the JSON copies of parsed YAML files.
+    SCENARIO_METADATA_KEYS (frozenset): `test_scenario` fields returned by `load_scenario_metadata()`.
 
 Usage:
     Use `load_yaml_file()` to read test scenario files.
+    Use `load_json_file()` for JSON files such as the connection config.
+    Use `load_yaml_file_cached()` for files that are loaded repeatedly, e.g. nested scenarios.
+    Use `load_yaml_subtree()` when only one top-level section is consumed.
+    Use `load_scenario_metadata()` to filter or list scenarios.
     Use `convert_yaml_to_json()` to transform YAML into JSON for downstream tools.
 ===============================================================================
 """
 
 import os
+import copy
 import json
+import hashlib
+import tempfile
+import threading
+import warnings
+from collections import OrderedDict
+from typing import Any
 import yaml
 
+try:
+    # libyaml C bindings; several times faster than the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader
+
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+    HAS_LIBYAML = False
+    warnings.warn(
+        "PyYAML is installed without libyaml; scenario files are parsed with the "
+        "slower pure-Python SafeLoader. Reinstall PyYAML with libyaml for faster loading.",
+        RuntimeWarning,
+    )
+
+try:
+    # C JSON codec for the on-disk cache; falls back to the standard library
+    import orjson
+
+    def _json_loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data)
+
+except ImportError:
+
+    def _json_loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+SCENARIO_CACHE_MAXSIZE = 1024
+SCENARIO_JSON_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "cpact",
+)
+
+# Fields of `test_scenario` read by `load_scenario_metadata()`.
+SCENARIO_METADATA_KEYS = frozenset(
+    ("test_id", "test_name", "test_group", "tags", "description", "test_description")
+)
+
+_scenario_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_scenario_cache_lock = threading.Lock()
+# Cache key tag for metadata entries; a plain string could collide with a subtree key.
+_METADATA = object()
+_MISSING = object()
+
 
 def load_yaml_file(file_path: str) -> dict | list:
     """
@@ -39,19 +110,297 @@ def load_yaml_file(file_path: str) -> dict | list:
 
     ext = os.path.splitext(file_path)[1].lower()
 
+    if ext in [".yaml", ".yml"]:
+        return _load_yaml(file_path)
+
+    if ext == ".json":
+        return load_json_file(file_path)
+    raise ValueError(f"Unsupported file type: {ext}")
+
+
+def load_json_file(file_path: str) -> Any:
+    """
+    Load a JSON file regardless of its extension, reading it in one call and
+    decoding with orjson when available.
+    """
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    try:
+        return _json_loads(raw)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON format in {file_path}: {e}")
+
+
+def _json_cache_path(file_path: str) -> str:
+    """
+    Return the path of the on-disk JSON copy for the current version of a YAML file.
+    The YAML's mtime and size are part of the name, so any change to either,
+    including a replacement with an older mtime, maps to a different copy.
+    """
+    st = os.stat(file_path)
+    digest = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+    return os.path.join(
+        SCENARIO_JSON_CACHE_DIR, f"{digest}-{st.st_mtime_ns}-{st.st_size}.json"
+    )
+
+
+def _read_json_cache(cache_path: str) -> Any:
+    """
+    Return the data of a JSON copy, or _MISSING when it is absent or unreadable.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            return _json_loads(f.read())
+    except (OSError, ValueError):
+        return _MISSING
+
+
+def _load_yaml(file_path: str) -> dict | list:
+    """
+    Load a YAML file, reading the JSON copy instead when one exists for the
+    YAML's current mtime and size.
+    """
+    cache_path = _json_cache_path(file_path)
+    data = _read_json_cache(cache_path)
+    if data is not _MISSING:
+        return data
+
+    with open(file_path, "r") as f:
+        try:
+            data = yaml.load(f, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML format in {file_path}: {e}")
+    _write_json_cache(cache_path, data)
+    return data
+
+
+def load_yaml_subtree(file_path: str, key: str) -> Any:
+    """
+    Load only the value under a top-level key of a YAML or JSON file.
+    For YAML the document is composed into nodes and only the requested subtree
+    is constructed, so sibling sections are never built into Python objects.
+    A current JSON copy is still preferred when one exists.
+    Raises KeyError if the key is not present.
+    """
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in [".yaml", ".yml"]:
+        return load_yaml_file(file_path)[key]
+
+    data = _read_json_cache(_json_cache_path(file_path))
+    if data is not _MISSING:
+        return data[key]
+
     with open(file_path, "r") as f:
-        if ext in [".yaml", ".yml"]:
-            try:
-                return yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                raise ValueError(f"Invalid YAML format in {file_path}: {e}")
-        elif ext == ".json":
-            try:
-                return json.load(f)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSON format in {file_path}: {e}")
+        loader = _YamlLoader(f)
+        try:
+            root = loader.get_single_node()
+            if isinstance(root, yaml.MappingNode):
+                loader.flatten_mapping(root)
+                for key_node, value_node in root.value:
+                    if loader.construct_object(key_node) == key:
+                        return loader.construct_object(value_node, deep=True)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML format in {file_path}: {e}")
+        finally:
+            loader.dispose()
+    raise KeyError(key)
+
+
+def _metadata_from(data: Any, file_path: str) -> dict | None:
+    """
+    Pick the metadata fields out of fully loaded scenario data.
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid scenario format in {file_path}: expected a mapping")
+    if "test_scenario" not in data:
+        return None
+    scenario = data["test_scenario"]
+    if not isinstance(scenario, dict):
+        raise ValueError(f"Invalid test_scenario in {file_path}: expected a mapping")
+    return {k: v for k, v in scenario.items() if k in SCENARIO_METADATA_KEYS}
+
+
+def _compose_metadata(file_path: str) -> dict | None:
+    """
+    Read the metadata fields of `test_scenario` from a YAML or JSON file. For YAML
+    only those fields are constructed; steps and other sections stay as nodes.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in [".yaml", ".yml"]:
+        return _metadata_from(load_yaml_file(file_path), file_path)
+
+    data = _read_json_cache(_json_cache_path(file_path))
+    if data is not _MISSING:
+        return _metadata_from(data, file_path)
+
+    with open(file_path, "r") as f:
+        loader = _YamlLoader(f)
+        try:
+            root = loader.get_single_node()
+            if not isinstance(root, yaml.MappingNode):
+                raise ValueError(
+                    f"Invalid scenario format in {file_path}: expected a mapping"
+                )
+            loader.flatten_mapping(root)
+            for key_node, value_node in root.value:
+                if loader.construct_object(key_node) != "test_scenario":
+                    continue
+                if not isinstance(value_node, yaml.MappingNode):
+                    raise ValueError(
+                        f"Invalid test_scenario in {file_path}: expected a mapping"
+                    )
+                loader.flatten_mapping(value_node)
+                metadata = {}
+                for field_node, field_value in value_node.value:
+                    field = loader.construct_object(field_node)
+                    if field in SCENARIO_METADATA_KEYS:
+                        metadata[field] = loader.construct_object(field_value, deep=True)
+                return metadata
+            return None
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML format in {file_path}: {e}")
+        finally:
+            loader.dispose()
+
+
+def _write_json_cache(cache_path: str, data: dict | list) -> None:
+    """
+    Write parsed YAML data to the JSON cache and drop the copies of earlier
+    versions of the same file. Data that does not survive a JSON round trip
+    (dates, non-string keys, ...) is not cached. Failures are ignored.
+    """
+    try:
+        raw = _json_dumps(data)
+        if _json_loads(raw) != data:
+            return
+        os.makedirs(SCENARIO_JSON_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=SCENARIO_JSON_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_path, cache_path)
+        cache_name = os.path.basename(cache_path)
+        prefix = cache_name.split("-", 1)[0] + "-"
+        for name in os.listdir(SCENARIO_JSON_CACHE_DIR):
+            if name.startswith(prefix) and name != cache_name:
+                os.remove(os.path.join(SCENARIO_JSON_CACHE_DIR, name))
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+class _FrozenDict(dict):
+    """
+    Read-only dict used for cached scenario data. It stays a dict for JSON
+    serialization and isinstance checks; deepcopy returns a mutable copy.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached scenario data is read-only; copy it before modifying.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (_FrozenDict, (dict(self),))
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Recursively convert dicts to read-only dicts and lists to tuples.
+    """
+    if isinstance(obj, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def load_yaml_file_cached(file_path: str, key: str = None) -> Any:
+    """
+    Load a YAML or JSON test scenario file through a bounded LRU cache.
+    Entries are keyed by absolute path, modification time and size, so edited
+    files are parsed again. When `key` is given only that top-level subtree is
+    loaded (see `load_yaml_subtree()`) and cached. The cached data is frozen once (dicts become read-only,
+    lists become tuples) and shared by all callers; use `copy.deepcopy()` to get
+    a mutable copy.
+    """
+    abs_path, file_key = _file_key(file_path)
+    cache_key = file_key + (key,)
+
+    data = _cache_get(cache_key)
+    if data is _MISSING:
+        if key is None:
+            data = _freeze(load_yaml_file(abs_path))
         else:
-            raise ValueError(f"Unsupported file type: {ext}")
+            data = _freeze(load_yaml_subtree(abs_path, key))
+        _cache_put(cache_key, data)
+    return data
+
+
+def load_scenario_metadata(file_path: str) -> dict | None:
+    """
+    Load the metadata fields of a scenario's `test_scenario` section (see
+    SCENARIO_METADATA_KEYS) without constructing its steps. Results share the
+    LRU cache of `load_yaml_file_cached()`, and a fully cached file is reused.
+    Returns None if the file has no `test_scenario` section; raises ValueError
+    if the file or the section is not a mapping.
+    """
+    abs_path, file_key = _file_key(file_path)
+
+    data = _cache_get(file_key + (None,))
+    if data is not _MISSING:
+        return _metadata_from(data, file_path)
+
+    cache_key = file_key + (_METADATA,)
+    metadata = _cache_get(cache_key)
+    if metadata is _MISSING:
+        metadata = _freeze(_compose_metadata(abs_path))
+        _cache_put(cache_key, metadata)
+    return metadata
+
+
+def _file_key(file_path: str) -> tuple[str, tuple]:
+    """
+    Return the absolute path of a file and its (path, mtime, size) cache key prefix.
+    """
+    abs_path = os.path.abspath(file_path)
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        raise FileNotFoundError(f"File not found: {file_path}")
+    return abs_path, (abs_path, st.st_mtime_ns, st.st_size)
+
+
+def _cache_get(cache_key: tuple) -> Any:
+    """
+    Return a cached entry and mark it recently used, or _MISSING.
+    """
+    with _scenario_cache_lock:
+        data = _scenario_cache.get(cache_key, _MISSING)
+        if data is not _MISSING:
+            _scenario_cache.move_to_end(cache_key)
+        return data
+
+
+def _cache_put(cache_key: tuple, data: Any) -> None:
+    """
+    Store an entry, evicting the least recently used ones beyond the limit.
+    """
+    with _scenario_cache_lock:
+        _scenario_cache[cache_key] = data
+        _scenario_cache.move_to_end(cache_key)
+        while len(_scenario_cache) > SCENARIO_CACHE_MAXSIZE:
+            _scenario_cache.popitem(last=False)
 
 
 def convert_yaml_to_json(yaml_path: str, output_dir: str = None) -> str:
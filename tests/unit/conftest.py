@@ -0,0 +1,38 @@
+"""
+Copyright (c) 2025 Open Compute Project
+Licensed under the MIT License.
+
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+
+===============================================================================
+Shared pytest setup for the CPACT unit tests. The framework modules import each
+other from the `cpact` directory (e.g. `from utils.logger_utils import TestLogger`),
+so that directory is put on `sys.path` here, and the TestLogger singleton is
+initialized under a temporary directory instead of `./logs`.
+===============================================================================
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+CPACT_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "cpact")
+)
+sys.path.insert(0, CPACT_DIR)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def test_logger():
+    """
+    Initializes the TestLogger singleton once per session under a temporary directory.
+    """
+    from utils.logger_utils import TestLogger
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = TestLogger(log_dir=log_dir)
+        yield logger
+        logger.cleanup()
@@ -0,0 +1,116 @@
+"""
+Copyright (c) 2025 Open Compute Project
+Licensed under the MIT License.
+
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+
+===============================================================================
+Unit tests for ExpressionEvaluator, one per operator family, checking that each
+entry criteria expression evaluates the same as Python's eval over the keys.
+===============================================================================
+"""
+
+import pytest
+
+from core.context import Context
+from expression.evaluator import ExpressionEvaluator
+
+KEYS = {
+    "status": "PASS - all links up",
+    "code": 1,
+    "count": 3,
+    "ratio": 0.5,
+    "ready": True,
+    "error": None,
+    "links": ["eth0", "eth1"],
+}
+
+
+@pytest.fixture
+def evaluator():
+    return ExpressionEvaluator(Context())
+
+
+def check(evaluator, expression, expected):
+    assert eval(expression, {}, dict(KEYS)) == expected
+    assert evaluator.evaluate([{"expression": expression}], KEYS) is expected
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("code == 1", True),
+        ("code != 1", False),
+        ("count > 2", True),
+        ("count >= 4", False),
+        ("ratio < 1", True),
+        ("-1 <= code <= 1", True),
+    ],
+)
+def test_comparison(evaluator, expression, expected):
+    check(evaluator, expression, expected)
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("ready and count > 2", True),
+        ("not ready or code == 0", False),
+        ("not (code == 0)", True),
+    ],
+)
+def test_boolean(evaluator, expression, expected):
+    check(evaluator, expression, expected)
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ('"PASS" in status', True),
+        ('"FAIL" not in status', True),
+        ('"eth2" in links', False),
+        ("code in [0, 1]", True),
+        ("code in (2, 3)", False),
+        ("count not in {1, 2}", True),
+    ],
+)
+def test_membership(evaluator, expression, expected):
+    check(evaluator, expression, expected)
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("error is None", True),
+        ("ready is not True", False),
+    ],
+)
+def test_identity(evaluator, expression, expected):
+    check(evaluator, expression, expected)
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("len(links) == 2", True),
+        ("count * 2 > 5", True),
+        ("links[0] == 'eth0'", True),
+        ("status.startswith('FAIL')", False),
+        ("code in [*links, 1]", True),
+    ],
+)
+def test_eval_fallback(evaluator, expression, expected):
+    check(evaluator, expression, expected)
+
+
+def test_combined_criteria(evaluator):
+    criteria = [{"expression": '"PASS" in status'}, {"expression": "len(links) > 1"}]
+    assert evaluator.evaluate(criteria, KEYS) is True
+    criteria.append({"expression": "error is not None"})
+    assert evaluator.evaluate(criteria, KEYS) is False
+
+
+def test_invalid_expression(evaluator):
+    assert evaluator.evaluate([{"expression": "code =="}], KEYS) is False
+    assert evaluator.evaluate([{"expression": "missing == 1"}], KEYS) is False
@@ -0,0 +1,47 @@
+"""
+Copyright (c) 2025 Open Compute Project
+Licensed under the MIT License.
+
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+
+===============================================================================
+Unit tests for format_grid_table, comparing its output with tabulate's "grid"
+format, which it replaces for the list commands.
+===============================================================================
+"""
+
+import pytest
+from tabulate import tabulate
+
+from main import format_grid_table
+
+TABLES = [
+    pytest.param(
+        [
+            ["TC-001", 1, 1.5, "Health", "  padded  "],
+            ["TC-002", 22, 10.25, "RAS", "multi\nline"],
+            ["TC-003", None, None, None, None],
+        ],
+        ["Test ID", "Steps", "Ratio", "Test Group", "Description"],
+        id="mixed",
+    ),
+    pytest.param(
+        [["a", "1", "2.50", True], ["b", "22", "1e10", False]],
+        ["Name", "Count", "Value", "Flag"],
+        id="numeric-strings",
+    ),
+    pytest.param(
+        [["x", -3, 0.001], ["yy", 100, 12345.678]],
+        ["Key", "Int", "Float"],
+        id="negative-and-small",
+    ),
+    pytest.param([], ["Test File", "Reason"], id="empty"),
+]
+
+
+@pytest.mark.parametrize("rows, headers", TABLES)
+def test_matches_tabulate_grid(rows, headers):
+    assert format_grid_table(rows, headers) == tabulate(
+        rows, headers=headers, tablefmt="grid"
+    )
@@ -0,0 +1,78 @@
+"""
+Copyright (c) 2025 Open Compute Project
+Licensed under the MIT License.
+
+This source code is licensed under the MIT license found in the
+LICENSE file in the root directory of this source tree.
+
+===============================================================================
+Unit tests for the widget-free `fast_result` of the recipe creator dialogs,
+checking it against `result()` of the auto-submitted dialog for the same data.
+===============================================================================
+"""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+
+# The recipe creator modules import each other from their own directory.
+RECIPE_CREATOR_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "cpact",
+    "scenario_recipe_creator",
+)
+sys.path.insert(0, os.path.normpath(RECIPE_CREATOR_DIR))
+
+from docker_widget import DockerDialog  # noqa: E402
+from entry_criteria_widget import EntryCriteriaDialog  # noqa: E402
+
+PROPERTIES = {
+    "expression": {"type": "string"},
+    "description": {"type": "string"},
+    "severity": {"type": "string", "enum": ["low", "high"]},
+    "enabled": {"type": "boolean"},
+}
+
+LOAD_DATA = [
+    pytest.param({"expression": "a\r\nb", "description": "c\rd"}, id="line-endings"),
+    pytest.param(
+        {"expression": "x\u2029y", "description": "non\xa0breaking"}, id="unicode"
+    ),
+    pytest.param(
+        {"expression": None, "severity": "high", "enabled": 1}, id="none-and-cast"
+    ),
+    pytest.param({"severity": "medium", "enabled": ""}, id="unknown-enum"),
+    pytest.param({"description": "  padded\t"}, id="missing-fields"),
+]
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.mark.parametrize("load_data", LOAD_DATA)
+def test_entry_criteria_fast_result_matches_dialog(app, load_data):
+    schema = {"items": {"properties": PROPERTIES, "required": ["expression"]}}
+    dialog = EntryCriteriaDialog(
+        entry_criteria_schema=schema, load_entry_criteria_data=load_data
+    )
+    assert EntryCriteriaDialog.fast_result(schema, load_data) == dialog.result()
+
+
+@pytest.mark.parametrize("load_data", LOAD_DATA)
+def test_docker_fast_result_matches_dialog(app, load_data):
+    schema = {"properties": PROPERTIES, "required": ["expression"]}
+    dialog = DockerDialog(docker_schema=schema, load_docker_data=load_data)
+    assert DockerDialog.fast_result(schema, load_data) == dialog.result()
+
+
+def test_fast_result_rejects_values_the_widgets_do_not_accept():
+    schema = {"items": {"properties": PROPERTIES}}
+    assert EntryCriteriaDialog.fast_result(schema, {"expression": 3}) is None